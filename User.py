@@ -9,6 +9,8 @@ class UserObserver(ABC):
     """
     Abstract base class for observing user changes.
     """
+    __slots__ = ()
+
     @abstractmethod
     def update(self, user, change_type):
         pass
@@ -18,6 +20,8 @@ class ProfileUpdateNotifier(UserObserver):
     """
     Notifies when a user updates their profile.
     """
+    __slots__ = ()
+
     def update(self, user, change_type):
         if change_type == "profile_updated":
             print(f" User {user.name} updated their profile.")
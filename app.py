@@ -18,14 +18,15 @@ SECRET_KEY = "your_secret_key"
 auth = HTTPTokenAuth(scheme="Bearer")  # Will be used as the authentication decorator "@auth" for
 # actions that require login
 
-# File Paths for data (by JSON)
-USERS_FILE = "data/users.json"
-ORDERS_FILE = "data/orders.json"
-CARTS_FILE = "data/shopping_carts.json"
+# File Paths for data (by JSON), the directory can be moved with the APP_DATA_DIR environment variable
+DATA_DIR = os.environ.get("APP_DATA_DIR", "data")
+USERS_FILE = os.path.join(DATA_DIR, "users.json")
+ORDERS_FILE = os.path.join(DATA_DIR, "orders.json")
+CARTS_FILE = os.path.join(DATA_DIR, "shopping_carts.json")
 inventory = Inventory()  # Assume Inventory is initialized from a file or database
 
-if not os.path.exists("data"):
-    os.makedirs("data")
+if not os.path.exists(DATA_DIR):
+    os.makedirs(DATA_DIR)
 
 if not os.path.exists(USERS_FILE):
     with open(USERS_FILE, "w") as f:
@@ -185,7 +186,7 @@ def save_carts_json():
     carts_data = {
         email: {
             "items": [
-                {"name": item.name, "type": item.__class__.__name__, "quantity": quantity}
+                {"name": item.name, "type": item.type, "quantity": quantity}
                 for item, quantity in cart.cart_items.items()
             ]
         }
@@ -1,3 +1,4 @@
+import sys
 from abc import ABC, abstractmethod
 
 
@@ -35,6 +36,8 @@ class Furniture(ABC):
      Base class to represent general furniture items.
      This class serves as a foundation for all specific furniture types.
      """
+    type = "Generic"  # Each derived class sets its own type name
+    _discount_cap = 50  # Maximum total discount percent of an item
 
     def __init__(self, u_id: str, name: str, description: str, material: str, color: str, wp: int,
                  price: float, dimensions: tuple, country: str, available_quantity: int = 0,
@@ -52,22 +55,24 @@ class Furniture(ABC):
         param dimensions: Tuple representing the dimensions (length, width, height) in cm.
         param available_quantity : int representing the current available quantity of the item.
         param country: Where the furniture from.
-        param type: str representing the item's type.
         param discount_strategy : representing the discount the item should have( the default is No Discount).
 
         """
         self.u_id = u_id
         self.name = name
         self.description = description
-        self.material = material
-        self.color = color
+        # Many items share the same material, color and country, so keep a single copy of each string
+        self.material = sys.intern(material)
+        self.color = sys.intern(color)
         self.wp = wp
         self.price = price
         self.dimensions = dimensions
-        self.country = country
+        self.country = sys.intern(country)
         self.available_quantity = available_quantity
-        self.type = "Generic"
         self.discount_strategy = discount_strategy
+        self._fixed_discount = 0  # Type-specific discount percent added on top of the strategy
+        self._discounted_price_key = None  # (price, discount_strategy) the cached discounted price was computed for
+        self._discounted_price = None
 
     def set_discount_strategy(self, discount_strategy: DiscountStrategy):
         self.discount_strategy = discount_strategy
@@ -80,6 +85,51 @@ class Furniture(ABC):
     def apply_discount(self, discount: DiscountStrategy) -> float:
         pass
 
+    def _set_fixed_discount(self, fixed_discount: float) -> None:
+        """
+        Store the type-specific discount percent, worked out once from the item's attributes.
+        Each furniture type calls it again whenever one of those attributes changes,
+        and the cached discounted price is dropped with the old value.
+
+        param fixed_discount: Discount percent added on top of the discount strategy.
+        """
+        self._fixed_discount = fixed_discount
+        self._discounted_price_key = None
+
+    def _capped_discount(self, discount_strategy: DiscountStrategy) -> float:
+        """
+        The discount formula shared by all furniture types: the strategy plus the fixed discount, capped at 50%.
+
+        param discount_strategy: Discount percentage base on the DiscountStrategy.
+        return: total discount percent of the item.
+        """
+        return min(discount_strategy.get_discount() + self._fixed_discount, self._discount_cap)
+
+    def _price_after_discount(self, discount_strategy: DiscountStrategy) -> float:
+        """
+        Apply the item's discount percent on its price.
+
+        param discount_strategy: Discount percentage base on the DiscountStrategy.
+        return: Discounted price of the item.
+        """
+        total_discount = self.calculate_discount(discount_strategy)
+        return Furniture.price_with_discount(self.price, total_discount)
+
+    @property
+    def discounted_price(self) -> float:
+        """
+        The price of the item after its own discount strategy, same as apply_discount(discount_strategy).
+        The value is cached and computed again only once the price, the discount strategy or the fixed discount
+        is changed.
+
+        return: Discounted price of the item.
+        """
+        key = self._discounted_price_key
+        if key is None or key[0] is not self.price or key[1] is not self.discount_strategy:
+            self._discounted_price = self.apply_discount(self.discount_strategy)
+            self._discounted_price_key = (self.price, self.discount_strategy)
+        return self._discounted_price
+
     @staticmethod
     def price_with_discount(price: float, discount: float) -> float:
         return round(price * (1 - discount / 100), 1)
@@ -104,6 +154,8 @@ class Chair(Furniture):
     """
     Represents a Chair.
     """
+    type = "Chair"
+
     def __init__(self, u_id: str, name: str, description: str, material: str, color: str, wp: int,
                  price: float, dimensions: tuple, country: str, available_quantity: int, has_armrests: bool):
         """
@@ -123,7 +175,15 @@ class Chair(Furniture):
         """
         super().__init__(u_id, name, description, material, color, wp, price, dimensions, country, available_quantity)
         self.has_armrests = has_armrests
-        self.type = "Chair"
+
+    @property
+    def has_armrests(self) -> bool:
+        return self._has_armrests
+
+    @has_armrests.setter
+    def has_armrests(self, has_armrests: bool) -> None:
+        self._has_armrests = has_armrests
+        self._set_fixed_discount(5 if has_armrests else 0)  # Armrests add 5% on top of the strategy
 
     def calculate_discount(self, discount_strategy: DiscountStrategy) -> float:
         """
@@ -132,9 +192,7 @@ class Chair(Furniture):
         param discount_strategy: Discount percentage base on the DiscountStrategy.
         return: total discount percent of the chair.
         """
-        additional_discount = 5 if self.has_armrests else 0
-        total_discount = min(discount_strategy.get_discount() + additional_discount, 50)  # Cap at 50%
-        return total_discount
+        return self._capped_discount(discount_strategy)
 
     def apply_discount(self, discount_strategy: DiscountStrategy) -> float:
         """
@@ -143,8 +201,7 @@ class Chair(Furniture):
         param discount_strategy: Discount percentage base on the DiscountStrategy.
         return: Discounted price of the chair.
         """
-        total_discount = self.calculate_discount(discount_strategy)
-        return Furniture.price_with_discount(self.price, total_discount)
+        return self._price_after_discount(discount_strategy)
 
     def chair_info(self):
         """Return chair-specific details."""
@@ -155,6 +212,7 @@ class Table(Furniture):
     """
     Represents a Table.
     """
+    type = "Table"
 
     def __init__(self, u_id: str, name: str, description: str, material: str, color: str, wp: int,
                  price: float, dimensions: tuple, country: str, available_quantity: int, shape: str,
@@ -178,18 +236,24 @@ class Table(Furniture):
         super().__init__(u_id, name, description, material, color, wp, price, dimensions, country, available_quantity)
         self.shape = shape  # Shape of the table (e.g., rectangular, circular)
         self.is_extendable = is_extendable  # Indicates if the table can expand
-        self.type = "Table"
+
+    @property
+    def is_extendable(self) -> bool:
+        return self._is_extendable
+
+    @is_extendable.setter
+    def is_extendable(self, is_extendable: bool) -> None:
+        self._is_extendable = is_extendable
+        self._set_fixed_discount(10 if is_extendable else 0)  # Extendable tables add 10% on top of the strategy
 
     def calculate_discount(self, discount_strategy: DiscountStrategy) -> float:
         """
-        Calculate the discounted percent of the Table.
+        Calculate the discounted percent of the table.
 
         param discount_strategy: Discount percentage base on the DiscountStrategy.
         return: total discount percent of the table.
         """
-        additional_discount = 10 if self.is_extendable else 0
-        total_discount = min(discount_strategy.get_discount() + additional_discount, 50)  # Cap at 50%
-        return total_discount
+        return self._capped_discount(discount_strategy)
 
     def apply_discount(self, discount_strategy: DiscountStrategy) -> float:
         """
@@ -198,8 +262,7 @@ class Table(Furniture):
         param discount_strategy: Discount percentage base on the DiscountStrategy.
         return: Discounted price of the table.
         """
-        total_discount = self.calculate_discount(discount_strategy)
-        return Furniture.price_with_discount(self.price, total_discount)
+        return self._price_after_discount(discount_strategy)
 
     def table_info(self):
         """Return table-specific details."""
@@ -211,6 +274,7 @@ class Sofa(Furniture):
     """
     Represents a Sofa.
     """
+    type = "Sofa"
 
     def __init__(self, u_id: str, name: str, description: str, material: str, color: str, wp: int,
                  price: float, dimensions: tuple, country: str, available_quantity: int, num_seats: int, has_recliner: bool):
@@ -233,18 +297,24 @@ class Sofa(Furniture):
         super().__init__(u_id, name, description, material, color, wp, price, dimensions, country, available_quantity)
         self.num_seats = num_seats  # Number of seats in the sofa
         self.has_recliner = has_recliner  # Whether the sofa has a reclining feature
-        self.type = "Sofa"
+
+    @property
+    def num_seats(self) -> int:
+        return self._num_seats
+
+    @num_seats.setter
+    def num_seats(self, num_seats: int) -> None:
+        self._num_seats = num_seats
+        self._set_fixed_discount(num_seats * 2)  # 2% per seat on top of the strategy
 
     def calculate_discount(self, discount_strategy: DiscountStrategy) -> float:
         """
-        Calculate the discounted percent of the Sofa.
+        Calculate the discounted percent of the sofa.
 
         param discount_strategy: Discount percentage base on the DiscountStrategy.
         return: total discount percent of the sofa.
         """
-        seat_based_discount = self.num_seats * 2  # 2% per seat
-        total_discount = min(discount_strategy.get_discount() + seat_based_discount, 50)  # Cap at 50%
-        return total_discount
+        return self._capped_discount(discount_strategy)
 
     def apply_discount(self, discount_strategy: DiscountStrategy) -> float:
         """
@@ -253,8 +323,7 @@ class Sofa(Furniture):
         param discount_strategy: Discount percentage base on the DiscountStrategy.
         return: Discounted price of the sofa.
         """
-        total_discount = self.calculate_discount(discount_strategy)
-        return Furniture.price_with_discount(self.price, total_discount)
+        return self._price_after_discount(discount_strategy)
 
     def sofa_info(self):
         """Return sofa-specific details."""
@@ -265,6 +334,7 @@ class Bed(Furniture):
     """
     Represents a Bed.
     """
+    type = "Bed"
 
     def __init__(self, u_id: str, name: str, description: str, material: str, color: str, wp: int,
                  price: float, dimensions: tuple, country: str, available_quantity: int, bed_size: str, has_storage: bool):
@@ -287,7 +357,15 @@ class Bed(Furniture):
         super().__init__(u_id, name, description, material, color, wp, price, dimensions, country, available_quantity)
         self.bed_size = bed_size  # Size of the bed (e.g., single, double, queen, king)
         self.has_storage = has_storage  # Whether the bed includes storage space
-        self.type = "Bed"
+
+    @property
+    def has_storage(self) -> bool:
+        return self._has_storage
+
+    @has_storage.setter
+    def has_storage(self, has_storage: bool) -> None:
+        self._has_storage = has_storage
+        self._set_fixed_discount(15 if has_storage else 0)  # Storage beds add 15% on top of the strategy
 
     def calculate_discount(self, discount_strategy: DiscountStrategy) -> float:
         """
@@ -296,19 +374,16 @@ class Bed(Furniture):
         param discount_strategy: Discount percentage base on the DiscountStrategy.
         return: total discount percent of the bed.
         """
-        storage_discount = 15 if self.has_storage else 0
-        total_discount = min(discount_strategy.get_discount() + storage_discount, 50)  # Cap at 50%
-        return total_discount
+        return self._capped_discount(discount_strategy)
 
     def apply_discount(self, discount_strategy: DiscountStrategy) -> float:
         """
-        Apply the discounted percent on the price of the table.
+        Apply the discounted percent on the price of the bed.
 
         param discount_strategy: Discount percentage base on the DiscountStrategy.
-        return: Discounted price of the table.
+        return: Discounted price of the bed.
         """
-        total_discount = self.calculate_discount(discount_strategy)
-        return Furniture.price_with_discount(self.price, total_discount)
+        return self._price_after_discount(discount_strategy)
 
     def bed_info(self):
         """Return bed-specific details."""
@@ -319,6 +394,7 @@ class Wardrobe(Furniture):
     """
     Represents a Wardrobe.
     """
+    type = "Wardrobe"
 
     def __init__(self, u_id: str, name: str, description: str, material: str, color: str, wp: int,
                  price: float, dimensions: tuple, country: str, available_quantity: int, num_doors: int, has_mirror: bool):
@@ -341,7 +417,15 @@ class Wardrobe(Furniture):
         super().__init__(u_id, name, description, material, color, wp, price, dimensions, country, available_quantity)
         self.num_doors = num_doors  # Number of doors in the wardrobe
         self.has_mirror = has_mirror  # Whether the wardrobe has a mirror
-        self.type = "Wardrobe"
+
+    @property
+    def num_doors(self) -> int:
+        return self._num_doors
+
+    @num_doors.setter
+    def num_doors(self, num_doors: int) -> None:
+        self._num_doors = num_doors
+        self._set_fixed_discount(num_doors * 3)  # 3% per door on top of the strategy
 
     def calculate_discount(self, discount_strategy: DiscountStrategy) -> float:
         """
@@ -350,9 +434,7 @@ class Wardrobe(Furniture):
         param discount_strategy: Discount percentage base on the DiscountStrategy.
         return: total discount percent of the wardrobe.
         """
-        door_discount = self.num_doors * 3  # 3% per door
-        total_discount = min(discount_strategy.get_discount() + door_discount, 50)  # Cap at 50%
-        return total_discount
+        return self._capped_discount(discount_strategy)
 
     def apply_discount(self, discount_strategy: DiscountStrategy) -> float:
         """
@@ -361,8 +443,7 @@ class Wardrobe(Furniture):
         param discount_strategy: Discount percentage base on the DiscountStrategy.
         return: Discounted price of the wardrobe.
         """
-        total_discount = self.calculate_discount(discount_strategy)
-        return Furniture.price_with_discount(self.price, total_discount)
+        return self._price_after_discount(discount_strategy)
 
     def wardrobe_info(self):
         """Return wardrobe-specific details."""
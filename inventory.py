@@ -1,28 +1,73 @@
+import logging
 from abc import ABC, abstractmethod
+from collections import deque
+from itertools import chain
 from furniture import Furniture
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 class InventoryObserver(ABC):
     """
     Abstract base class for observers watching inventory changes.
     """
+    __slots__ = ()
 
     @abstractmethod
     def update(self, item: Furniture, change_type):
         pass
 
+    def bulk_update(self, items, change_type):
+        """
+        Handle a change that affected several items at once.
+        Observers can override this to process the whole batch in one go.
+        """
+        for item in items:
+            self.update(item, change_type)
+
 
 class LowStockNotifier(InventoryObserver):
     """
     Notifies when an item's stack is low.
+    Warnings are collected in a buffer and written to the log in one batch on flush().
     """
-    def __init__(self, threshold=5):
+    __slots__ = ("threshold", "buffered", "pending")
+
+    def __init__(self, threshold=5, buffered=False):
+        """
+        param threshold: Stock quantity at or below which a warning is issued.
+        param buffered: If True, warnings are kept until flush() is called (e.g. after a bulk import),
+                        otherwise they are logged right away.
+        """
         self.threshold = threshold
+        self.buffered = buffered
+        self.pending = deque(maxlen=1024)  # (item name, quantity) pairs waiting to be logged
 
     def update(self, item: Furniture, change_type: str):
         if change_type in ("added", "updated") and item.available_quantity <= self.threshold:
-            print(f"Warning: Low stock for {item.name}! Only {item.available_quantity} left.")
+            self.pending.append((item.name, item.available_quantity))
+            if not self.buffered:
+                self.flush()
+
+    def bulk_update(self, items, change_type: str):
+        if change_type not in ("added", "updated"):
+            return
+        self.pending.extend((item.name, item.available_quantity) for item in items
+                            if item.available_quantity <= self.threshold)
+        if not self.buffered:
+            self.flush()
+
+    def flush(self):
+        """
+        Write all the buffered low stock warnings to the log as a single record.
+        """
+        if not self.pending:
+            return
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("\n".join(f"Warning: Low stock for {name}! Only {quantity} left."
+                                     for name, quantity in self.pending))
+        self.pending.clear()
 
 
 class Inventory:
@@ -44,9 +89,20 @@ class Inventory:
         self.observers.remove(observer)
 
     def notify_observers(self, item: Furniture, change_type):
+        if not self.observers:
+            return
         for observer in self.observers:
             observer.update(item, change_type)
 
+    def notify_observers_bulk(self, items, change_type):
+        """
+        Notify the observers once about a change that affected several items (e.g. a batch import).
+        """
+        if not self.observers:
+            return
+        for observer in self.observers:
+            observer.bulk_update(items, change_type)
+
     def get_furniture_type(self, item_name: str) -> Optional[str]:
         """
         Get the furniture type based on the item name.
@@ -60,19 +116,38 @@ class Inventory:
                 return furniture_type
         return None
 
+    def get_item(self, name: str, furniture_type: str) -> Optional[Furniture]:
+        """
+        Get a furniture item by its name and type.
+        param name: Name of the furniture item.
+        param furniture_type: Type of the furniture item (e.g., "Chair", "Table").
+        return: The furniture object if found, otherwise None.
+        """
+        return self.items_by_type.get(furniture_type, {}).get(name)
+
+    def find_by_name(self, name: str) -> Optional[Furniture]:
+        """
+        Get a furniture item by its name only, when its type is not known.
+        param name: Name of the furniture item.
+        return: The furniture object if found, otherwise None.
+        """
+        for items in self.items_by_type.values():
+            item = items.get(name)
+            if item is not None:
+                return item
+        return None
+
     def add_item(self, item: Furniture):
         """
         Add a furniture item to the inventory or update its quantity if it already exists.
         param item: The furniture object to be added.
         """
-        furniture_type = item.type  # Get the class name as the type
-        if furniture_type in self.items_by_type:
-            if item.name in self.items_by_type[furniture_type]:
-                self.items_by_type[furniture_type][item.name].available_quantity += item.available_quantity
-            else:
-                self.items_by_type[furniture_type][item.name] = item
+        type_items = self.items_by_type.setdefault(item.type, {})
+        existing_item = type_items.get(item.name)
+        if existing_item is not None:
+            existing_item.available_quantity += item.available_quantity
         else:
-            self.items_by_type[furniture_type] = {item.name: item}
+            type_items[item.name] = item
         self.notify_observers(item, "added")
 
     def remove_item(self, name: str, furniture_type: str):
@@ -82,12 +157,11 @@ class Inventory:
         param name: Name of the furniture item to remove.
         param furniture_type: Type of the furniture item (e.g., "Chair", "Table").
         """
-        if furniture_type in self.items_by_type and name in self.items_by_type[furniture_type]:
-            item = self.items_by_type[furniture_type][name]
-            del self.items_by_type[furniture_type][name]
-            self.notify_observers(item, "removed")
-        else:
+        item = self.items_by_type.get(furniture_type, {}).pop(name, None)
+        if item is None:
             print(f"Item '{name}' of type '{furniture_type}' not found in inventory.")
+            return
+        self.notify_observers(item, "removed")
 
     def update_quantity(self, name: str, furniture_type: str, new_quantity: int) -> bool:
         """
@@ -97,16 +171,16 @@ class Inventory:
         param furniture_type: Type of the furniture item (e.g., "Chair", "Table").
         param new_quantity: New quantity to set for the item.
         """
-        if furniture_type in self.items_by_type and name in self.items_by_type[furniture_type]:
-            self.items_by_type[furniture_type][name].available_quantity = new_quantity
-
-            self.notify_observers(self.items_by_type[furniture_type][name], "updated")
-            print(f" Successfully updated {name} to quantity {new_quantity}")
-            return True
-        else:
+        item = self.get_item(name, furniture_type)
+        if item is None:
             print(f"Item '{name}' of type '{furniture_type}' not found in inventory.")
             return False
 
+        item.available_quantity = new_quantity
+        self.notify_observers(item, "updated")
+        print(f" Successfully updated {name} to quantity {new_quantity}")
+        return True
+
     def search_by_type(self, furniture_type: str):
         """
         Search for all furniture items of a specific type.
@@ -134,23 +208,19 @@ class Inventory:
         """
         Returns all items in the inventory, formatted for API output.
         """
-        all_items = []
-        for furniture_type, items in self.items_by_type.items():
-            for item in items.values():
-                all_items.append({
-                    'id': item.u_id,
-                    'name': item.name,
-                    'description': item.description,
-                    'material': item.material,
-                    'color': item.color,
-                    'warranty_period': item.wp,
-                    'price': item.price,
-                    'dimensions': item.dimensions,
-                    'country': item.country,
-                    'type': item.type,
-                    'available_quantity': item.available_quantity
-                })
-        return all_items
+        return [{
+            'id': item.u_id,
+            'name': item.name,
+            'description': item.description,
+            'material': item.material,
+            'color': item.color,
+            'warranty_period': item.wp,
+            'price': item.price,
+            'dimensions': item.dimensions,
+            'country': item.country,
+            'type': item.type,
+            'available_quantity': item.available_quantity
+        } for item in chain.from_iterable(items.values() for items in self.items_by_type.values())]
 
     def view_inventory(self):
         """
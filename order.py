@@ -1,7 +1,50 @@
 import uuid
 import csv
+import io
+import mmap
 import os
 import sys
+import threading
+
+CSV_READ_BUFFER_SIZE = 1 << 17  # 128 KiB, fewer read calls when scanning a large orders file
+
+
+class _RandPool:
+    """
+    Hands out random UUID4 ids from a pool of os.urandom bytes that is refilled 4 KiB at a time,
+    instead of reading 16 random bytes from the OS for every order.
+    """
+
+    def __init__(self, size=4096):
+        self._size = size
+        self._pool = b""
+        self._offset = size
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """
+        Drop the remaining random bytes, so a forked worker never reuses its parent's pool.
+        """
+        self._pool = b""
+        self._offset = self._size
+        self._lock = threading.Lock()
+
+    def uuid4_hex(self):
+        """
+        return: A random UUID4 as 32 hex characters (same format as uuid.uuid4().hex).
+        """
+        with self._lock:
+            if self._offset + 16 > self._size:
+                self._pool = os.urandom(self._size)
+                self._offset = 0
+            random_bytes = self._pool[self._offset:self._offset + 16]
+            self._offset += 16
+        return uuid.UUID(bytes=random_bytes, version=4).hex
+
+
+_RANDPOOL = _RandPool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_RANDPOOL.reset)
 
 
 class Order:
@@ -9,22 +52,27 @@ class Order:
     Represents an order placed by a user.
     Storing details about the order, including items, total price, and status.
     """
+    __slots__ = ("order_id", "user", "items", "total_price", "status", "shipping_address", "payment_method",
+                 "_str_prefix")
+    CSV_HEADER = ["order_id", "user_email", "shipping_address", "payment_method", "items", "total_price", "status"]
 
-    def __init__(self, user, items, total_price):
+    def __init__(self, user, items, total_price, order_id=None):
         """
         Initialize an Order object.
 
         param user: User who placed the order.
         param items: Dictionary of items in the order {Furniture: quantity}.
         param total_price: Total price of the order after discounts.
+        param order_id: Pre-generated order ID (optional, e.g. when importing orders in bulk).
         """
-        self.order_id = str(uuid.uuid4())  # Unique identifier for the order
+        self.order_id = order_id if order_id is not None else _RANDPOOL.uuid4_hex()  # Unique identifier for the order
         self.user = user
         self.items = items
         self.total_price = total_price
         self.status = "Pending"  # Default status is "Pending"
         self.shipping_address = user.address
         self.payment_method = user.payment_method
+        self._str_prefix = None  # Cached "items | total" part of __str__, built on first use
 
     def complete_order(self):
         """
@@ -45,57 +93,232 @@ class Order:
         """
         String representation of the order.
         """
-        items_str = ", ".join([f"{name} x {quantity}" for name, quantity, price in self.items])
-        return (f"Order {self.order_id}: {items_str} | Total: ${self.total_price:.2f} | Status: {self.status} | "
+        # The items and total never change after the order is placed, only the status does
+        if self._str_prefix is None:
+            items_str = ", ".join(f"{name} x {quantity}" for name, quantity, price in self.items)
+            self._str_prefix = f"{items_str} | Total: ${self.total_price:.2f}"
+        return (f"Order {self.order_id}: {self._str_prefix} | Status: {self.status} | "
                 f"Shipping to: {self.shipping_address} | Payment method: {self.payment_method}")
 
-    def save_order_to_csv(self, filename=None):
+    def _row(self):
+        """
+        Build the CSV row that represents this order.
+        """
+        items_str = "|".join(f"{name} x {quantity} (${price:.2f})"
+                             for name, quantity, price in self.items)
+        return [self.order_id, self.user.email, self.shipping_address, self.payment_method, items_str,
+                f"${self.total_price:.2f}", self.status]
+
+    def _csv_line(self):
+        """
+        Format this order as one ready-to-write CSV line.
+        """
+        return Order._format_csv_line(self._row())
+
+    @staticmethod
+    def _format_csv_line(fields):
+        """
+        Join fields into a CSV line the same way csv.writer does with the default dialect.
+        A field is only quoted when it contains a comma, a quote or a line break, which is rare for orders.
+
+        param fields: List of values for one row.
+        return: The formatted line, terminated by "\r\n".
+        """
+        cells = []
+        for field in fields:
+            field = str(field)
+            if "," in field or '"' in field or "\n" in field or "\r" in field:
+                field = '"' + field.replace('"', '""') + '"'
+            cells.append(field)
+        return ",".join(cells) + "\r\n"
+
+    def save_order_to_csv(self, filename=None, writer=None):
         """
         Save Order details to a CSV file.
+
+        param filename: CSV file to append the order to.
+        param writer: An already open csv.writer to reuse (e.g. inside a batch loop).
+        """
+        if writer is not None:
+            writer.writerow(self._row())
+            return
+        Order.save_many_to_csv([self], filename)
+
+    @staticmethod
+    def save_many_to_csv(orders, filename=None):
+        """
+        Save several orders to a CSV file, opening it only once.
+
+        param orders: Iterable of Order objects.
+        param filename: CSV file to append the orders to.
         """
         if filename is None:
             filename = "test_orders.csv" if "pytest" in sys.modules else "orders.csv"
         print(f"Saving order to {filename}")
 
-        file_exists = os.path.exists(filename)
-        with open(filename, mode="a", newline="") as file:
-            writer = csv.writer(file)
-            if not file_exists:
-                writer.writerow(["order_id", "user_email", "shipping_address", "payment_method",
-                                 "items", "total_price", "status"])
-
-            items_str = "|".join([f"{name} x {quantity} (${price:.2f})"
-                                  for name, quantity, price in self.items])
-
-            writer.writerow([self.order_id, self.user.email, self.shipping_address, self.payment_method, items_str,
-                            f"${self.total_price:.2f}", self.status])
+        with OrderCsvSink(filename) as sink:
+            sink.extend(orders)
 
         print(f"Order saved successfully to {filename}.")
 
     @staticmethod
-    def load_orders_from_csv(filename="orders.csv"):
+    def iter_orders_from_csv(filename="orders.csv"):
         """
-        Load orders from a CSV file.
+        Lazily load orders from a CSV file, yielding one order dictionary per row.
         """
-        orders = []
         try:
-            with open(filename, mode="r") as file:
+            with open(filename, mode="r", newline="", encoding="utf-8", buffering=CSV_READ_BUFFER_SIZE) as file:
                 reader = csv.reader(file)
                 next(reader, None)
-                for row in reader:
-                    if len(row) < 7:  # Check if there are enough columns
-                        continue
-                    order = {
-                        "order_id": row[0],
-                        "user_email": row[1],
-                        "shipping_address": row[2],
-                        "payment_method": row[3],
-                        "items": row[4].split("|"),
-                        "total_price": row[5],
-                        "status": row[6]
-                    }
-                    orders.append(order)
+                yield from Order._orders_from_rows(reader)
             print("Orders loaded successfully from CSV.")
         except FileNotFoundError:
             print("Orders CSV file not found.")
+
+    @staticmethod
+    def _orders_from_rows(rows):
+        """
+        Turn parsed CSV rows into order dictionaries, skipping rows with missing columns.
+        """
+        for row in rows:
+            if len(row) < len(Order.CSV_HEADER):  # Check if there are enough columns
+                continue
+            order = dict(zip(Order.CSV_HEADER, row))
+            order["items"] = order["items"].split("|")
+            yield order
+
+    @staticmethod
+    def load_orders_from_csv(filename="orders.csv"):
+        """
+        Load orders from a CSV file.
+        """
+        return list(Order.iter_orders_from_csv(filename))
+
+    @staticmethod
+    def load_orders_from_csv_parallel(filename="orders.csv", workers=None, min_parallel_size=1 << 20):
+        """
+        Load orders from a large CSV file by parsing blocks of it in several processes.
+        The file is split on line boundaries, so this relies on every order being written on a single line
+        (which save_order_to_csv does unless an address contains a line break).
+
+        param filename: CSV file to load the orders from.
+        param workers: Number of worker processes (default: the number of CPUs).
+        param min_parallel_size: Files smaller than this many bytes are loaded in the current process.
+        return: List of order dictionaries, in file order.
+        """
+        try:
+            size = os.path.getsize(filename)
+        except FileNotFoundError:
+            print("Orders CSV file not found.")
+            return []
+        workers = workers or os.cpu_count() or 1
+        if size == 0 or size < min_parallel_size or workers == 1:
+            return Order.load_orders_from_csv(filename)
+
+        # Find block boundaries right after a newline, starting after the header line
+        with open(filename, mode="rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = data.find(b"\n") + 1
+            if start == 0:
+                return []
+            bounds = [start]
+            step = max((size - start) // workers, 1)
+            for i in range(1, workers):
+                newline = data.find(b"\n", max(start + i * step, bounds[-1]))
+                if newline == -1 or newline + 1 >= size:
+                    break
+                bounds.append(newline + 1)
+            bounds.append(size)
+
+        # Imported here, the process pool pulls in multiprocessing which every other caller can skip
+        from concurrent.futures import ProcessPoolExecutor
+
+        starts, ends = bounds[:-1], bounds[1:]
+        with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+            blocks = executor.map(_parse_order_block, [filename] * len(starts), starts, ends)
+            orders = [order for block in blocks for order in block]
+        print("Orders loaded successfully from CSV.")
         return orders
+
+
+class OrderCsvSink:
+    """
+    Keeps an orders CSV file open while many orders are appended to it.
+    The file is opened and checked for a header once, and rows go through the file's write buffer
+    until the sink is flushed or closed.
+    """
+
+    def __init__(self, filename=None):
+        """
+        Initialize an OrderCsvSink object.
+
+        param filename: CSV file to append the orders to (default: test_orders.csv under pytest, otherwise orders.csv).
+        """
+        if filename is None:
+            filename = "test_orders.csv" if "pytest" in sys.modules else "orders.csv"
+        self.filename = filename
+        self._file = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        """
+        Open the CSV file for appending, writing the header first if the file is new.
+        """
+        if self._file is not None:
+            return
+        self._file = open(self.filename, mode="a", newline="", encoding="utf-8")
+        if self._file.tell() == 0:  # Append mode starts at the end, so position 0 means a new (or empty) file
+            self._file.write(Order._format_csv_line(Order.CSV_HEADER))
+
+    def append(self, order):
+        """
+        Append a single order to the file.
+
+        param order: Order object to write.
+        """
+        self.open()
+        self._file.write(order._csv_line())
+
+    def extend(self, orders):
+        """
+        Append several orders to the file with a single write.
+
+        param orders: Iterable of Order objects.
+        """
+        self.open()
+        self._file.write("".join(order._csv_line() for order in orders))
+
+    def flush(self):
+        """
+        Push the buffered rows to the file.
+        """
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        """
+        Flush and close the file. The sink can be reopened by appending to it again.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _parse_order_block(filename, start, end):
+    """
+    Parse the orders between two byte offsets of an orders CSV file (runs in a worker process).
+
+    param filename: CSV file to read.
+    param start: Offset of the first byte of the block, at the start of a line.
+    param end: Offset right after the last byte of the block, at the end of a line.
+    return: List of order dictionaries found in the block.
+    """
+    with open(filename, mode="rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode("utf-8")
+    return list(Order._orders_from_rows(csv.reader(io.StringIO(text, newline=""))))
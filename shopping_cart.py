@@ -1,44 +1,86 @@
 from typing import Dict, List, Optional
 import csv
+import io
+import logging
 import os
 import sys
+import threading
+from contextlib import contextmanager
 from User import User
 from furniture import Furniture, DiscountStrategy, NoDiscount
 from order import Order
 from inventory import Inventory
 from abc import ABC, abstractmethod
-import builtins
 
-original_open = builtins.open
+logger = logging.getLogger(__name__)
 
+CSV_READ_BUFFER_SIZE = 1 << 16  # 64 KiB, fewer read calls on a large carts file
+CART_CSV_HEADER_LINE = "user_email,item_name,quantity,price\n"  # Header line exactly as save_cart_to_csv writes it
 
-def debug_open(*args, **kwargs):
-    print(f"Opening file: {args[0]} | Mode: {kwargs.get('mode', 'r')}")
-    return original_open(*args, **kwargs)
 
+@contextmanager
+def _replacing_file(filename: str):
+    """
+    Give the name of a temporary file to write the new content of a file into.
+    When the block succeeds, the temporary file replaces the file in one step, so a crash in the middle of
+    the write never leaves a half-written file behind. When it fails, the temporary file is removed.
+    The process and thread ids in the temporary name keep concurrent writers of the same file apart.
 
-builtins.open = debug_open
+    param filename: The file to replace.
+    return: The temporary file name, to be used in a with statement.
+    """
+    temp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield temp_filename
+        os.replace(temp_filename, filename)
+    except BaseException:
+        try:
+            os.remove(temp_filename)
+        except OSError:
+            pass  # The temporary file was never created
+        raise
 
 
 class CartObserver(ABC):
     """
     Abstract observer for monitoring cart changes.
     """
+    __slots__ = ()
+    _single_item_changes = {"bulk_added": "added"}  # Bulk change type -> the change type of each of its items
+
     @abstractmethod
     def update(self, cart: 'ShoppingCart', change_type: str, item: Optional[Furniture] = None) -> None:
         pass
 
+    def bulk_update(self, cart: 'ShoppingCart', change_type: str, items: Dict[Furniture, int]) -> None:
+        """
+        Handle a change that affected several cart items at once.
+        Observers can override this to report the whole batch in one go,
+        by default update() is called for every item with the matching single item change (e.g. "added").
+        """
+        change_type = self._single_item_changes.get(change_type, change_type)
+        for item in items:
+            self.update(cart, change_type, item)
+
 
 class CartNotifier(CartObserver):
     """
     Notifies when an item is added or removed from the cart.
     """
+    __slots__ = ()
+
     def update(self, cart: 'ShoppingCart', change_type: str, item: Optional[Furniture] = None) -> None:
         if change_type == "added":
             print(f"Item '{item.name}' added to cart. ")
         elif change_type == "removed":
             print(f"Item '{item.name}' removed from cart.")
 
+    def bulk_update(self, cart: 'ShoppingCart', change_type: str, items: Dict[Furniture, int]) -> None:
+        if change_type == "bulk_added":
+            print(f"{sum(items.values())} items added to cart. ")
+        else:
+            super().bulk_update(cart, change_type, items)
+
 
 class ShoppingCart:
     """
@@ -64,9 +106,20 @@ class ShoppingCart:
         self.observers.append(observer)
 
     def notify_observers(self, change_type: str, item: Optional[Furniture] = None) -> None:
+        if not self.observers:
+            return
         for observer in self.observers:
             observer.update(self, change_type, item)
 
+    def notify_observers_bulk(self, change_type: str, items: Dict[Furniture, int]) -> None:
+        """
+        Notify the observers once about a change that affected several items.
+        """
+        if not self.observers:
+            return
+        for observer in self.observers:
+            observer.bulk_update(self, change_type, items)
+
     def set_cart_discount_strategy(self, discount_strategy: DiscountStrategy) -> None:
         """
         Set a discount strategy for the entire cart.This will be used as the last step in the checkout.
@@ -80,23 +133,53 @@ class ShoppingCart:
         param item: Furniture object to add.
         param quantity: Quantity of the item to add (default: 1).
         """
+        self._check_stock(item, quantity)
+        self._add_to_cart(item, quantity)
+        self.notify_observers("added", item)
+
+    def add_items_bulk(self, items) -> None:
+        """
+        Add several furniture items to the cart and notify the observers once.
+        Every item is checked against the inventory before anything is added, so an invalid item leaves the cart
+        unchanged.
+
+        param items: Dictionary of {Furniture: quantity}, or an iterable of (Furniture, quantity) pairs.
+        """
+        added: Dict[Furniture, int] = {}
+        for item, quantity in (items.items() if isinstance(items, dict) else items):
+            self._check_stock(item, quantity)
+            added[item] = added.get(item, 0) + quantity
+
+        for item, quantity in added.items():
+            self._add_to_cart(item, quantity)
+        if added:
+            self.notify_observers_bulk("bulk_added", added)
+
+    def _check_stock(self, item: Furniture, quantity: int) -> None:
+        """
+        Check the requested quantity of an item against the inventory.
+        Raises ValueError for an invalid or unavailable quantity and KeyError for an unknown item.
+        """
         if not isinstance(quantity, int) or quantity <= 0:
             raise ValueError("Quantity must be a positive integer")
-        if item.name not in self.inventory.items_by_type.get(item.type, {}):
+        stock_item = self.inventory.get_item(item.name, item.type)
+        if stock_item is None:
             raise KeyError(f"Item {item.name} does not exist in inventory.")
 
-        available_quantity = self.inventory.items_by_type.get(item.type, {}).get(item.name, item).available_quantity
+        available_quantity = stock_item.available_quantity
         if available_quantity < quantity:
             raise ValueError(f"Not enough stock units for {item.name}. Available only: {available_quantity}"
                   f", Requested: {quantity}")
 
+    def _add_to_cart(self, item: Furniture, quantity: int) -> None:
+        """
+        Add an already checked quantity of an item to the cart, without notifying observers.
+        """
         if item in self.cart_items:
             self.cart_items[item] += quantity
         else:
             self.cart_items[item] = quantity
 
-        self.notify_observers("added", item)
-
     def remove_item(self, item: Furniture, quantity: int = 1) -> None:
         """
         Remove a furniture item or reduce its quantity in the cart.
@@ -124,10 +207,11 @@ class ShoppingCart:
             print("Your cart is empty.")
             return
 
-        print(f"Shopping Cart for {self.user.name}:")
-        for item, quantity in self.cart_items.items():
-            print(f"- {item.name}: {quantity} x ${item.price:.2f} = ${item.price * quantity:.2f}")
-        print(f"Total: ${self.calculate_total():.2f}")
+        lines = [f"Shopping Cart for {self.user.name}:"]
+        lines.extend(f"- {item.name}: {quantity} x ${item.price:.2f} = ${item.price * quantity:.2f}"
+                     for item, quantity in self.cart_items.items())
+        lines.append(f"Total: ${self.calculate_total():.2f}")
+        print("\n".join(lines))  # A single write for the whole cart
 
     def calculate_total(self, tax_percentage: float = 18) -> float:
         """
@@ -137,8 +221,18 @@ class ShoppingCart:
 
         returns: float: Total price as a float including discounts and tax.
         """
-        total = sum(item.apply_discount(item.discount_strategy) * quantity
+        total = sum(item.discounted_price * quantity
                     for item, quantity in self.cart_items.items())
+        return self._finalize_total(total, tax_percentage)
+
+    def _finalize_total(self, total: float, tax_percentage: float = 18) -> float:
+        """
+        Apply the cart-wide discount and the tax to the sum of the discounted item prices.
+
+        param total: Sum of the items' discounted prices times their quantities.
+        param tax_percentage: The tax rate to apply to the total after discounts.
+        return: Total price rounded to cents.
+        """
         cart_discount = self.discount_strategy.get_discount()
         total_after_discount = Furniture.price_with_discount(total, cart_discount)
         total_with_tax = total_after_discount * (1 + tax_percentage / 100)
@@ -153,23 +247,34 @@ class ShoppingCart:
         print("\nStarting checkout process...")
         print(f"Shipping to: {self.user.address}")
         print(f"Payment method: {self.user.payment_method}")
-        print(f"Current inventory before update: {self.inventory.items_by_type}")
-
-        # Validate items against inventory
+        logger.debug("Current inventory before update: %s", self.inventory.items_by_type)
+
+        # Validate items against inventory and sum up their discounted prices in the same pass,
+        # staging the stock deductions and the order lines until the payment goes through.
+        # Cart lines of the same item (same name and type) are added up, so their total is checked against the stock
+        requested = {}  # {(name, type): [stock item, cart item, total quantity]}
+        order_items = []
+        subtotal = 0
+        get_stock_item = self.inventory.get_item
         for item, quantity in self.cart_items.items():
-            available_quantity = self.inventory.items_by_type.get(type(item).__name__, {}).get(item.name, item)\
-                .available_quantity
-
-            if available_quantity < quantity:
-                print(f"Not enough stock for {item.name}. Available: {available_quantity}, Requested: {quantity}")
+            entry = requested.get((item.name, item.type))
+            if entry is None:
+                entry = requested[(item.name, item.type)] = [get_stock_item(item.name, item.type), item, 0]
+            entry[2] += quantity
+            available_quantity = (entry[0] or item).available_quantity
+
+            if available_quantity < entry[2]:
+                print(f"Not enough stock for {item.name}. Available: {available_quantity}, Requested: {entry[2]}")
                 return None
+            subtotal += item.discounted_price * quantity
+            order_items.append((item.name, quantity, item.price))
 
         if not self.cart_items:
             print("Checkout failed: Cart is empty.")
             return None
 
-        # Apply discounts and calculate final total
-        total_price = self.calculate_total()
+        # Apply the cart discount and tax to get the final total (same result as calculate_total)
+        total_price = self._finalize_total(subtotal)
 
         if total_price == 0:
             print("Checkout failed: Total price is 0.")
@@ -182,27 +287,33 @@ class ShoppingCart:
             print("Payment failed. Please try again.")
             return None
 
-        # Deduct inventory and create order
-        for item, quantity in self.cart_items.items():
-            new_quantity = self.inventory.items_by_type[item.type][item.name].available_quantity - quantity
-            success = self.inventory.update_quantity(item.name, item.type, new_quantity)
-            if success:
-                print(f" {quantity} units of '{item.name}' have been deducted from inventory.")
-            else:
-                print(f" Warning: Could not update stock for '{item.name}'.")
+        # Deduct inventory and create order. The stock items were already looked up during validation,
+        # so the quantities are taken off them directly and the inventory observers are notified once
+        updated_items = []
+        deduction_lines = []
+        for stock_item, item, quantity in requested.values():
+            if stock_item is None:
+                deduction_lines.append(f" Warning: Could not update stock for '{item.name}'.")
+                continue
+            stock_item.available_quantity -= quantity  # From the current stock, not the one seen during validation
+            updated_items.append(stock_item)
+            deduction_lines.append(f" {quantity} units of '{item.name}' have been deducted from inventory.")
+        if updated_items:
+            self.inventory.notify_observers_bulk(updated_items, "updated")
+        print("\n".join(deduction_lines))  # A single write for all the items
         # Create and complete order
         order = Order(
             user=self.user,
-            items=[(item.name, quantity, item.price) for item, quantity in self.cart_items.items()],
+            items=order_items,
             total_price=total_price
         )
         order.complete_order()
-        print(f" Cart content before checkout: {self.cart_items}")
+        logger.debug("Cart content before checkout: %s", self.cart_items)
 
         order.save_order_to_csv()  # Saving the current order to the CSV file
 
         cart_filename = "test_carts.csv" if "pytest" in sys.modules else "carts.csv"
-        print(f"🛒 Calling clear_cart_from_csv with filename: {cart_filename}")
+        logger.debug("Calling clear_cart_from_csv with filename: %s", cart_filename)
         self.clear_cart_from_csv(filename=cart_filename)
         self.user.add_order_to_history(order)  # Save order to user's order history
         print("Checkout completed successfully!")
@@ -231,25 +342,25 @@ class ShoppingCart:
         """
         expected_header = ["user_email", "item_name", "quantity", "price"]
         temp_data = []
+        buffer = io.StringIO()  # The new file content, formatted in memory so the file gets a single write
         user_exists = False
 
         # Reading the current data
         if os.path.exists(filename) and os.stat(filename).st_size > 0:
-            with open(filename, mode='r', newline='') as file:
-                reader = csv.reader(file)
-                headers = next(reader, None)
-
-                if headers != expected_header:
-                    print("Incorrect CSV header detected! Overwriting file.")
-                    temp_data.append(expected_header)
+            with open(filename, mode='r', newline='', buffering=CSV_READ_BUFFER_SIZE) as file:
+                if file.readline() == CART_CSV_HEADER_LINE:
+                    # Fast path: other users' rows are kept as they are, without going through the csv module
+                    prefix = self.user.email + ","
+                    write = buffer.write
+                    write(CART_CSV_HEADER_LINE)
+                    for line in file:
+                        if line.startswith(prefix):
+                            user_exists = True
+                        elif line.strip():
+                            write(line if line.endswith("\n") else line + "\n")
                 else:
-                    temp_data.append(headers)
-
-                for row in reader:
-                    if row and row[0] == self.user.email:
-                        user_exists = True
-                        continue
-                    temp_data.append(row)
+                    file.seek(0)
+                    user_exists = self._read_other_carts(file, expected_header, temp_data)
         else:
             print("File does not exist or is empty. Adding header.")
             temp_data.append(expected_header)
@@ -259,56 +370,83 @@ class ShoppingCart:
         print(f"{action} cart for {self.user.email} to CSV.")
 
         # Add new user's data
-        for item, quantity in self.cart_items.items():
-            temp_data.append([self.user.email, item.name, quantity, item.price])
-        print(f"Final data before writing: {temp_data}")
-
-        print("Writing data to CSV:", temp_data)
+        user_email = self.user.email
+        temp_data.extend([user_email, item.name, quantity, item.price]
+                         for item, quantity in self.cart_items.items())
 
         # Writing the new data
-        with open(filename, mode="w", newline="") as file:
-            writer = csv.writer(file, lineterminator="\n")
-            writer.writerows(temp_data)
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerows(temp_data)
+
+        # The new content goes to a temporary file first and replaces the carts file in one step
+        with _replacing_file(filename) as temp_filename:
+            with open(temp_filename, mode="w", newline="") as file:
+                file.write(buffer.getvalue())
+                file.flush()
+                os.fsync(file.fileno())
+        logger.debug("Data written successfully to %s", filename)
+
+    def _read_other_carts(self, file, expected_header: List[str], temp_data: list) -> bool:
+        """
+        Parse a carts CSV file with the csv module, keeping every row that doesn't belong to this user.
 
-            print(f"Data written successfully to {filename}")
-        print(f"Cart for {self.user.email} {'Updated' if user_exists else 'Saved'} to CSV.")
+        param file: Open carts file, positioned at its start.
+        param expected_header: The header the carts file should have.
+        param temp_data: List the header and the other users' rows are appended to.
+        return: True if the file had rows of this user.
+        """
+        user_exists = False
+        reader = csv.reader(file)
+        headers = next(reader, None)
+
+        if headers != expected_header:
+            print("Incorrect CSV header detected! Overwriting file.")
+            temp_data.append(expected_header)
+        else:
+            temp_data.append(headers)
+
+        user_email = self.user.email
+        for row in reader:
+            if row and row[0] == user_email:
+                user_exists = True
+                continue
+            temp_data.append(row)
+        return user_exists
 
     def load_cart_from_csv(self, filename: str = "cart_data.csv") -> None:
         """
         Load the last shopping cart for the user from the CSV file.
         """
-        print("Checking if file exists...")
+        logger.debug("Checking if %s exists...", filename)
         if not os.path.exists(filename):
             print("File does not exist.")
             return
 
-        print("File exists, loading data...")
+        logger.debug("File exists, loading data...")
         self.cart_items = {}
-        with open(filename, mode="r", newline="") as file:
+        with open(filename, mode="r", newline="", buffering=CSV_READ_BUFFER_SIZE) as file:
             reader = csv.reader(file)
 
             # Read headers first
             headers = next(reader, None)
-            print("Headers:", headers)
+            logger.debug("Headers: %s", headers)
 
             expected_header = ["user_email", "item_name", "quantity", "price"]
             if headers != expected_header:
                 print(f"Incorrect CSV header detected while loading. Expected {expected_header}, but got {headers}.")
                 return
 
-            # Process data rows
-            for row in reader:
-                print("Reading row:", row)
-                if row and row[0] == self.user.email:
+            # Process data rows. Other users' lines are skipped on a plain prefix check, only the
+            # current user's lines go through the csv parser (emails never need quoting in CSV)
+            user_email = self.user.email
+            prefix = user_email + ","
+            for row in csv.reader(line for line in file if line.startswith(prefix)):
+                if row and row[0] == user_email:
                     item_name, quantity = row[1], int(row[2])
-                    furniture_type = self.inventory.get_furniture_type(item_name)
-
-                    if furniture_type:
-                        item = self.inventory.items_by_type[furniture_type].get(item_name)
-                        if item:
-                            self.cart_items[item] = quantity
-                        else:
-                            print(f"Warning: Item {item_name} not found in inventory.")
+                    item = self.inventory.find_by_name(item_name)
+
+                    if item is not None:
+                        self.cart_items[item] = quantity
                     else:
                         print(f"Warning! Could not determine furniture type for '{item_name}'")
         print(f"Loaded previous cart for {self.user.email}. Cart items: {self.cart_items}")
@@ -316,19 +454,41 @@ class ShoppingCart:
     def clear_cart_from_csv(self, filename: str = "carts.csv") -> None:
         """
         Remove the user's cart from the CSV after checkout.
+        save_cart_to_csv writes the user's rows at the end of the file, so usually the file is just
+        truncated before them; it is only rewritten when other carts were saved after the user's one.
         """
-        if not os.path.exists(filename):
+        prefix = (self.user.email + ",").encode()
+        user_start = None  # Byte offset of the user's first row
+        has_other_rows = False
+        other_rows_after_user = False
+        try:
+            with open(filename, mode="rb", buffering=CSV_READ_BUFFER_SIZE) as file:
+                offset = len(file.readline())  # Skip the header
+                for line in file:
+                    if line.startswith(prefix):
+                        if user_start is None:
+                            user_start = offset
+                    elif line.strip():
+                        has_other_rows = True
+                        other_rows_after_user = other_rows_after_user or user_start is not None
+                    offset += len(line)
+        except FileNotFoundError:
             return
-        # Keeping only the other users' carts
-        with open(filename, mode="r", newline="") as file:
-            reader = csv.reader(file)
-            rows = [row for row in reader if row and row[0] != self.user.email]
-        if rows:
-            # Saving back the remaining carts of other users
-            with open(filename, mode="w", newline="") as file:
-                writer = csv.writer(file)
-                writer.writerow(["user_email", "item_name", "quantity", "price"])
-                writer.writerows(rows)
-                print(f" Cart for {self.user.email} cleared after checkout.")
-        else:
+
+        if user_start is None:
+            return  # The user has no saved cart, so the file doesn't need to be changed
+        if not has_other_rows:
             os.remove(filename)
+            return
+        if other_rows_after_user:
+            # Copying the header and the remaining carts of other users to a new file, row by row,
+            # then swapping it in so a crash never leaves a half-written carts file behind
+            with _replacing_file(filename) as temp_filename, \
+                    open(filename, mode="rb", buffering=CSV_READ_BUFFER_SIZE) as source, \
+                    open(temp_filename, mode="wb", buffering=CSV_READ_BUFFER_SIZE) as target:
+                target.write(source.readline())
+                target.writelines(line for line in source if line.strip() and not line.startswith(prefix))
+        else:
+            with open(filename, mode="r+b") as file:
+                file.truncate(user_start)
+        print(f" Cart for {self.user.email} cleared after checkout.")
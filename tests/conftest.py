@@ -0,0 +1,75 @@
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+# The modules under test live in the repository root, next to this tests directory
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+# Module level dictionaries of app.py that the API endpoints read and change
+APP_STATE_DICTS = ("users", "users_roles", "orders", "shopping_carts")
+# Functions of app.py that write that state to the data/*.json files
+APP_SAVE_FUNCTIONS = ("save_users_json", "save_orders_json", "save_carts_json")
+
+
+def pytest_configure(config):
+    """
+    Point app.py at a temporary data directory, so the tests never read or write the real data/*.json files.
+    When the suite runs with pytest-xdist (pytest -n auto --dist loadfile), every worker also gets its own
+    working directory, so the test CSV files written by the tests never collide between workers.
+    Runs before the test modules are collected, so app.py picks the directory up when it is imported.
+    The directories are created under TMPDIR, e.g. TMPDIR=/dev/shm pytest tests keeps them in memory.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        os.chdir(make_scratch_dir(f"pytest-{worker}-"))
+    os.environ["APP_DATA_DIR"] = make_scratch_dir(f"app-data-{worker or 'main'}-")
+
+
+def pytest_unconfigure(config):
+    os.chdir(config.invocation_params.dir)
+
+
+def make_scratch_dir(prefix):
+    """
+    Create a temporary directory that is removed when the test run exits.
+    The removal is registered before app.py is imported, so it runs after app.py's own atexit handler
+    that saves the data files into the directory.
+
+    param prefix: Prefix of the directory name.
+    return: Path of the new directory.
+    """
+    path = tempfile.mkdtemp(prefix=prefix)
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+@pytest.fixture
+def app_state(monkeypatch):
+    """
+    Give a test its own copy of the module level state of app.py (users, roles, orders, carts and inventory).
+    Whatever the test adds or removes is undone afterwards, so tests don't depend on the ones that ran before them.
+    The state isn't written to the data/*.json files during the test, the files would otherwise keep what is undone.
+
+    return: The app module, its state can be used as app_state.users, app_state.inventory etc.
+    """
+    import app as app_module
+
+    saved_state = {name: dict(getattr(app_module, name)) for name in APP_STATE_DICTS}
+    saved_inventory = {furniture_type: dict(items)
+                       for furniture_type, items in app_module.inventory.items_by_type.items()}
+    for name in APP_SAVE_FUNCTIONS:
+        monkeypatch.setattr(app_module, name, lambda: None)
+    yield app_module
+
+    for name, contents in saved_state.items():
+        state = getattr(app_module, name)
+        state.clear()
+        state.update(contents)
+    app_module.inventory.items_by_type.clear()
+    app_module.inventory.items_by_type.update(saved_inventory)
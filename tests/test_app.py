@@ -1,28 +1,38 @@
-import pytest
-import base64
 import os
+import pytest
 from unittest.mock import patch, MagicMock
-from app import app, users, orders, get_jwt_token, inventory, users_roles, save_users_json
+from app import app, users, get_jwt_token, users_roles
 from User import User
 from furniture import Chair
 from shopping_cart import ShoppingCart
 
 SECRET_KEY = "your_secret_key"
 
-
-if not os.path.exists("data/users.json"):
-    with open("data/users.json", "w") as f:
-        f.write("{}")
+# Every API test gets its own copy of the app's users, roles, orders, carts and inventory
+pytestmark = pytest.mark.usefixtures("app_state")
 
 
-@pytest.fixture
-def client():
+@pytest.fixture(scope="session")
+def session_client():
+    """One Flask test client for all the API tests, the app keeps no cookies or session between requests"""
     with app.test_client() as client:
         yield client
 
 
 @pytest.fixture
-def create_test_user():
+def client(app_state, session_client):
+    return session_client
+
+
+@pytest.fixture(autouse=True)
+def mute_cart_csv(monkeypatch):
+    """The API tests don't check the carts CSV files, so saving and loading them is skipped"""
+    monkeypatch.setattr(ShoppingCart, "save_cart_to_csv", lambda self, *args, **kwargs: None)
+    monkeypatch.setattr(ShoppingCart, "load_cart_from_csv", lambda self, *args, **kwargs: None)
+
+
+@pytest.fixture
+def create_test_user(app_state):
     """Create a test user before running authentication-based tests"""
     user = User(
         name="Test User",
@@ -32,13 +42,11 @@ def create_test_user():
         payment_method="Credit Card")
     users[user.email] = user
     users_roles[user.email] = "client"
-    print(f"✅ Created Test User: {user.email}, Role: {users_roles[user.email]}")
-    save_users_json()
     return user
 
 
 @pytest.fixture
-def create_admin_user():
+def create_admin_user(app_state):
     """Create a test admin user before running authentication-based tests"""
     admin_user = User(
         name="Admin",
@@ -49,27 +57,52 @@ def create_admin_user():
     )
     users[admin_user.email] = admin_user
     users_roles[admin_user.email] = "admin"
-    print(f"✅ Created Admin User: {admin_user.email}, Role: {users_roles[admin_user.email]}")
-    save_users_json()
     return admin_user
 
 
-def get_auth_headers(email, password):
-    """"
-    Helper function to generate Authorization headers for HTTP Basic Authentication
-    """
-    credentials = f"{email}:{password}"
-    encoded_credentials = base64.b64encode(credentials.encode()).decode("utf-8")
-    return {"Authorization": f"Basic {encoded_credentials}"}
+@pytest.fixture
+def admin_headers(create_admin_user):
+    """Headers of a JSON request authenticated as the test admin"""
+    return get_bearer_headers(create_admin_user)
 
 
-def test_search_existing_furniture(client):
-    """Test searching for an existing furniture item."""
-    inventory.items_by_type.setdefault("Chair", {})["Office Chair"] = Chair(
+@pytest.fixture
+def office_chair():
+    """The office chair most of the API tests work with"""
+    return Chair(
         u_id="001", name="Office Chair", description="Ergonomic chair",
         material="Metal", color="Black", wp=2, price=100.0, dimensions=(60, 60, 120),
         country="USA", available_quantity=5, has_armrests=True
     )
+
+
+@pytest.fixture
+def seeded_inventory(app_state, office_chair):
+    """The app's inventory with the office chair in stock, it is taken out again after the test"""
+    app_state.inventory.items_by_type.setdefault("Chair", {})["Office Chair"] = office_chair
+    return app_state.inventory
+
+
+def get_bearer_headers(user):
+    """
+    Helper function to generate the headers of a JSON request authenticated with the user's JWT token.
+    The token carries the user's current role, so it is made at the time of the request.
+    """
+    return {
+        "Authorization": f"Bearer {get_jwt_token(user)}",
+        "Content-Type": "application/json"
+    }
+
+
+def test_data_files_are_kept_out_of_the_repository(app_state):
+    """The API tests must never write their test users, orders and carts into the repository's data directory."""
+    repository_data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+    assert os.path.abspath(app_state.DATA_DIR) != repository_data_dir
+    assert os.path.dirname(os.path.abspath(app_state.USERS_FILE)) == os.path.abspath(app_state.DATA_DIR)
+
+
+def test_search_existing_furniture(client, seeded_inventory):
+    """Test searching for an existing furniture item."""
     response = client.get("/furniture/search", query_string={"name": "Office Chair", "type": "Chair"})
 
     assert response.status_code == 200
@@ -101,12 +134,8 @@ def test_search_furniture_missing_parameters(client):
     assert response.json["error"] == "Both 'name' and 'type' parameters are required"
 
 
-@patch.object(ShoppingCart, "save_cart_to_csv", MagicMock())
-@patch.object(ShoppingCart, "load_cart_from_csv", MagicMock())
 def test_register_user(client):
     """Test user registration endpoint."""
-    if "test@example.com" in users:
-        del users["test@example.com"]
     response = client.post("/register", json={
         "name": "Test User",
         "email": "test@example.com",
@@ -114,14 +143,10 @@ def test_register_user(client):
         "address": "123 Test St",
         "payment_method": "Credit Card"
     })
-    print("Registration response:", response.json)
     assert response.status_code == 201, f"Expected 201, got {response.status_code}"
     assert "test@example.com" in users, "User was not registered in 'users' dictionary"
-    print("User registered successfully:", users["test@example.com"])
 
 
-@patch.object(ShoppingCart, "save_cart_to_csv", MagicMock())
-@patch.object(ShoppingCart, "load_cart_from_csv", MagicMock())
 def test_login_user(client, create_test_user):
     """Test user login and receiving JWT token endpoint."""
     if create_test_user.email not in users or not isinstance(users[create_test_user.email], User):
@@ -137,74 +162,40 @@ def test_login_user(client, create_test_user):
     assert "token" in data, "Token should be returned after login"
 
 
-@patch.object(ShoppingCart, "save_cart_to_csv", MagicMock())
-@patch.object(ShoppingCart, "load_cart_from_csv", MagicMock())
 def test_view_cart(client, create_test_user):
     """Test viewing the shopping cart."""
-    token = get_jwt_token(create_test_user)
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+    headers = get_bearer_headers(create_test_user)
 
     response = client.get("/cart/view", query_string={"user_email": "test@example.com"}, headers=headers)
     assert response.status_code == 200
 
 
-@patch.object(ShoppingCart, "save_cart_to_csv", MagicMock())
-@patch.object(ShoppingCart, "load_cart_from_csv", MagicMock())
 def add_item_to_cart(client, create_test_user):
     """Test adding an item to the cart."""
-    token = get_jwt_token(create_test_user)
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+    headers = get_bearer_headers(create_test_user)
 
     response = client.post("/cart/add", json={
         "user_email": "test@example.com",
         "item_name": "Office Chair",
         "quantity": 1
     }, headers=headers)
-    print(response.status_code)
     assert response.status_code in [200, 404]
 
 
 @patch.object(ShoppingCart, "remove_item", MagicMock())
-@patch.object(ShoppingCart, "save_cart_to_csv", MagicMock())
-@patch.object(ShoppingCart, "load_cart_from_csv", MagicMock())
-def test_remove_item_from_cart(client, create_test_user):
+def test_remove_item_from_cart(client, create_test_user, seeded_inventory, office_chair, app_state):
     """Test removing an existing item from the cart."""
-
-    global shopping_carts
-    shopping_carts = {}
+    shopping_carts = app_state.shopping_carts
     test_user_email = create_test_user.email
 
     if test_user_email not in users or not isinstance(users[test_user_email], User):
         users[test_user_email] = create_test_user
     users_roles[test_user_email] = "client"
 
-    print(f"Users in system: {users}")
-    print(f"Roles in system: {users_roles}")
-
-    token = get_jwt_token(create_test_user)
-    print(f"Token for user {test_user_email}: {token}")
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
-    chair_item = Chair(
-        u_id="001", name="Office Chair", description="Ergonomic chair",
-        material="Metal", color="Black", wp=2, price=100.0, dimensions=(60, 60, 120),
-        country="USA", available_quantity=5, has_armrests=True
-    )
-    if "Chair" not in inventory.items_by_type:
-        inventory.items_by_type["Chair"] = {}
-    inventory.items_by_type["Chair"]["Office Chair"] = chair_item
+    headers = get_bearer_headers(create_test_user)
 
-    shopping_carts[test_user_email] = ShoppingCart(users[test_user_email], inventory)
-    shopping_carts[test_user_email].add_item(chair_item, 2)
+    shopping_carts[test_user_email] = ShoppingCart(users[test_user_email], seeded_inventory)
+    shopping_carts[test_user_email].add_item(office_chair, 2)
 
     assert shopping_carts[test_user_email].cart_items, "Cart should not be empty before removing item!"
     assert "Office Chair" in [item.name for item in shopping_carts[test_user_email].cart_items], \
@@ -224,51 +215,31 @@ def test_remove_item_from_cart(client, create_test_user):
 
 
 @patch.object(ShoppingCart, "checkout", return_value=MagicMock(order_id="1234", total_price=500.0, status="Completed"))
-@patch.object(ShoppingCart, "save_cart_to_csv", MagicMock())
-@patch.object(ShoppingCart, "load_cart_from_csv", MagicMock())
 @patch("flask.testing.FlaskClient.put", return_value=MagicMock(status_code=200, json=lambda: {"message": "Item added"}))
-def test_checkout_success(mock_checkout, mock_put, client, create_test_user):
+def test_checkout_success(mock_checkout, mock_put, client, create_test_user, app_state, seeded_inventory,
+                          office_chair):
     """Test successful checkout process with mocking."""
-    print("Mock checkout applied:", mock_checkout)
-    print("Mock put applied:", mock_put)
 
     test_user_email = "test@example.com"
     users[test_user_email] = create_test_user
 
-    token = get_jwt_token(create_test_user)
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+    headers = get_bearer_headers(create_test_user)
 
-    inventory.items_by_type.setdefault("Chair", {})["Office Chair"] = Chair(
-        u_id="001",
-        name="Office Chair",
-        description="Ergonomic chair",
-        material="Metal",
-        color="Black",
-        wp=2,
-        price=100.0,
-        dimensions=(60, 60, 120),
-        country="USA",
-        available_quantity=5,
-        has_armrests=True
-    )
+    shopping_carts = app_state.shopping_carts
+    shopping_carts[test_user_email] = ShoppingCart(create_test_user, seeded_inventory)
+    shopping_carts[test_user_email].add_item(office_chair, 1)
+    # app_state puts the original orders back after the test
+    app_state.orders[test_user_email] = shopping_carts[test_user_email]
+    assert shopping_carts[test_user_email].cart_items, "Cart should not be empty before checkout!"
 
-    shopping_carts[test_user_email] = ShoppingCart(create_test_user, inventory)
-    shopping_carts[test_user_email].add_item(inventory.items_by_type["Chair"]["Office Chair"], 1)
-    with patch.dict(orders, {test_user_email: shopping_carts[test_user_email]}):
-        assert shopping_carts[test_user_email].cart_items, "Cart should not be empty before checkout!"
-        print("Cart before checkout:", shopping_carts[test_user_email].cart_items)
-
-        add_response = client.put("/cart/add", json={
-            "user_email": test_user_email,
-            "name": "Office Chair",
-            "type": "Chair",
-            "quantity": 1
-        }, headers=headers)
+    add_response = client.put("/cart/add", json={
+        "user_email": test_user_email,
+        "name": "Office Chair",
+        "type": "Chair",
+        "quantity": 1
+    }, headers=headers)
 
-        assert add_response.status_code == 200, f"Adding item to cart failed! Response:{add_response.json}"
+    assert add_response.status_code == 200, f"Adding item to cart failed! Response:{add_response.json}"
 
     response = client.post("/cart/checkout", json={"user_email": test_user_email}, headers=headers)
 
@@ -281,11 +252,7 @@ def test_manage_inventory_as_admin(client, create_test_user):
     """Test adding an item to inventory as admin"""
     create_test_user.email = "admin@example.com"
 
-    token = get_jwt_token(create_test_user)
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+    headers = get_bearer_headers(create_test_user)
 
     response = client.post("/admin/inventory/manage", json={
             "name": "Luxury Sofa",
@@ -297,95 +264,30 @@ def test_manage_inventory_as_admin(client, create_test_user):
     assert response.status_code in [201, 403]
 
 
-def test_admin_cannot_manage_inventory_without_admin_role(client, create_test_user):
-    """Test that a regular user cannot manage inventory"""
-    token = get_jwt_token(create_test_user)
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
-    response = client.post("/admin/inventory/manage", json={
-        "name": "Luxury Sofa",
-        "type": "Sofa",
-        "price": 500.0,
-        "quantity": 10
-    }, headers=headers)
-
-    assert response.status_code == 403
-
-
-def test_view_orders_as_admin(client, create_admin_user):
+def test_view_orders_as_admin(client, admin_headers):
     """Test that an admin can view orders"""
-    admin_user = create_admin_user
-    if admin_user.email not in users:
-        users[admin_user.email] = admin_user
-
-    users_roles[admin_user.email] = "admin"
-
-    token = get_jwt_token(admin_user)
-    print(f"Token for admin {admin_user.email}: {token}")
-
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
-    response = client.get("/admin/orders", headers=headers)
-    print("Admin orders response:", response.json if response.is_json else response.data)
+    response = client.get("/admin/orders", headers=admin_headers)
 
     assert response.status_code in [200, 404], f"Unexpected response: {response.status_code}"
 
 
-def test_regular_user_cannot_view_orders(client, create_test_user):
-    """Test that a regular user cannot view orders"""
-    token = get_jwt_token(create_test_user)
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
-    response = client.get("/admin/orders", headers=headers)
-    assert response.status_code == 403
-
-
-def test_manage_users_as_admin(client, create_admin_user):
+def test_manage_users_as_admin(client, admin_headers):
     """Test that an admin can manage users"""
-    admin_user = create_admin_user
-    users[admin_user.email] = admin_user
-    users_roles[create_admin_user.email] = "admin"
-    token = get_jwt_token(admin_user)
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
-    response = client.get("/admin/manage_users", headers=headers)
+    response = client.get("/admin/manage_users", headers=admin_headers)
 
     assert response.status_code == 200, f"Unexpected response: {response.status_code}, {response.data}"
 
 
-def test_regular_user_cannot_manage_users(client, create_test_user):
-    """Test that a regular user cannot manage users"""
-    token = get_jwt_token(create_test_user)
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
-
-    response = client.get("/admin/manage_users", headers=headers)
-    assert response.status_code == 403
-
-
-def test_client_cannot_access_admin(client, create_test_user):
-    """Regular clients should NOT access admin functions"""
-    token = get_jwt_token(create_test_user)
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+@pytest.mark.parametrize("method, url, payload", [
+    ("POST", "/admin/inventory/manage", {"name": "Luxury Sofa", "type": "Sofa", "price": 500.0, "quantity": 10}),
+    ("GET", "/admin/orders", None),
+    ("GET", "/admin/manage_users", None),
+])
+def test_client_cannot_access_admin(client, create_test_user, method, url, payload):
+    """Regular clients should NOT access admin functions (manage inventory, view orders, manage users)"""
+    headers = get_bearer_headers(create_test_user)
 
-    response = client.get("/admin/manage_users", headers=headers)
+    response = client.open(url, method=method, json=payload, headers=headers)
     assert response.status_code == 403  # Access Denied
 
 #
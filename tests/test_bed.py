@@ -7,9 +7,10 @@ from furniture import Bed
 
 
 class TestBed(unittest.TestCase):
-    def setUp(self):
-        """Set up test cases"""
-        self.beds = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up test cases once, the tests only read them (test_is_available restores what it changes)"""
+        cls.beds = {
             "With Storage": Bed(
                 u_id="S6GoqL", name="Cozy Bed", description="A compact plastic bed queen.",
                 material="Plastic", color="Natural Oak", wp=2, price=129.0,
@@ -23,7 +24,7 @@ class TestBed(unittest.TestCase):
                 bed_size="Single", has_storage=False
             )
         }
-        self.discounts = {
+        cls.discounts = {
             "No Discount": NoDiscount(),
             "Holiday Discount": HolidayDiscount(),
             "VIP Discount": VIPDiscount(),
@@ -81,6 +82,7 @@ class TestBed(unittest.TestCase):
 
         # Set quantity to 0 and check again
         for bed_type, bed in self.beds.items():
+            self.addCleanup(setattr, bed, "available_quantity", bed.available_quantity)
             bed.available_quantity = 0
             with self.subTest(bed=bed_type + " (Out of Stock)"):
                 self.assertFalse(bed.is_available())
@@ -7,9 +7,10 @@ from furniture import Chair
 
 
 class TestChair(unittest.TestCase):
-    def setUp(self):
-        """Set up test cases"""
-        self.chairs = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up test cases once, the tests only read them (test_is_available restores what it changes)"""
+        cls.chairs = {
             "With Armrests": Chair(
                 u_id="C001", name="Office Chair", description="Ergonomic office chair",
                 material="Leather", color="Black", wp=5, price=200.0,
@@ -23,7 +24,7 @@ class TestChair(unittest.TestCase):
                 has_armrests=False
             )
         }
-        self.discounts = {
+        cls.discounts = {
             "No Discount": NoDiscount(),
             "Holiday Discount": HolidayDiscount(),
             "VIP Discount": VIPDiscount(),
@@ -78,6 +79,7 @@ class TestChair(unittest.TestCase):
 
         # Set quantity to 0 and check again
         for chair_type, chair in self.chairs.items():
+            self.addCleanup(setattr, chair, "available_quantity", chair.available_quantity)
             chair.available_quantity = 0
             with self.subTest(chair=chair_type + " (Out of Stock)"):
                 self.assertFalse(chair.is_available())
@@ -7,6 +7,8 @@ from furniture import NoDiscount
 from furniture import HolidayDiscount
 from furniture import VIPDiscount
 from furniture import ClearanceDiscount
+from furniture import Furniture
+from furniture import FurnitureFactory
 
 
 def test_discount_strategy_is_abstract():
@@ -14,24 +16,44 @@ def test_discount_strategy_is_abstract():
         DiscountStrategy()
 
 
-def test_no_discount():
-    strategy = NoDiscount()
-    assert strategy.get_discount() == 0, "NoDiscount should always return 0"
+@pytest.mark.parametrize("strategy_class, expected", [
+    (NoDiscount, 0),
+    (HolidayDiscount, 15),
+    (VIPDiscount, 20),
+    (ClearanceDiscount, 30),
+])
+def test_discount_strategies(strategy_class, expected):
+    strategy = strategy_class()
+    assert strategy.get_discount() == expected, f"{strategy_class.__name__} should return {expected}"
 
 
-def test_holiday_discount():
-    strategy = HolidayDiscount()
-    assert strategy.get_discount() == 15, "HolidayDiscount should return 15"
+def test_furniture_is_abstract():
+    with pytest.raises(TypeError):
+        Furniture("01", "Chair", "Generic chair", "Wood", "Black", 2, 100.0, (50, 50, 50), "USA")
+
+
+def test_fixed_discount_follows_attribute_changes():
+    chair = FurnitureFactory.create_furniture("Chair", name="Office Chair", has_armrests=False)
+    sofa = FurnitureFactory.create_furniture("Sofa", name="Luxury Sofa", num_seats=2, has_recliner=False)
+    assert chair.calculate_discount(HolidayDiscount()) == 15
+    assert sofa.calculate_discount(HolidayDiscount()) == 19
+
+    chair.has_armrests = True
+    sofa.num_seats = 4
+    assert chair.calculate_discount(HolidayDiscount()) == 20
+    assert sofa.calculate_discount(HolidayDiscount()) == 23
+    assert chair.discounted_price == 95.0
 
 
-def test_vip_discount():
-    strategy = VIPDiscount()
-    assert strategy.get_discount() == 20, "VIPDiscount should return 20"
+def test_discounted_price_follows_price_and_strategy():
+    chair = FurnitureFactory.create_furniture("Chair", name="Office Chair", price=200.0, has_armrests=True)
+    assert chair.discounted_price == chair.apply_discount(chair.discount_strategy)
 
+    chair.set_discount_strategy(VIPDiscount())
+    assert chair.discounted_price == chair.apply_discount(VIPDiscount())
 
-def test_clearance_discount():
-    strategy = ClearanceDiscount()
-    assert strategy.get_discount() == 30, "ClearanceDiscount should return 30"
+    chair.price = 300.0
+    assert chair.discounted_price == chair.apply_discount(VIPDiscount())
 
 
 if __name__ == '__main__':
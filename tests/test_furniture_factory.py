@@ -47,6 +47,13 @@ class TestFurnitureFactory(unittest.TestCase):
             FurnitureFactory.create_furniture("Lamp", name="Table Lamp")
         self.assertEqual(str(context.exception), "Unknown furniture type: Lamp")
 
+    def test_shared_attributes_are_interned(self):
+        first = FurnitureFactory.create_furniture("Chair", name="Chair 1", has_armrests=True, material="".join(["Oa", "k"]))
+        second = FurnitureFactory.create_furniture("Chair", name="Chair 2", has_armrests=True, material="".join(["O", "ak"]))
+        self.assertIs(first.material, second.material)
+        self.assertIs(first.color, second.color)
+        self.assertIs(first.country, second.country)
+
 
 if __name__ == "__main__":
     unittest.main()
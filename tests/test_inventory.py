@@ -132,6 +132,16 @@ class TestInventory(unittest.TestCase):
         self.observer1.update.assert_called_once_with(self.table, "updated")
         self.observer2.update.assert_called_once_with(self.table, "updated")
 
+    def test_notify_observers_bulk(self):
+        self.inventory.add_observer(self.observer1)
+        self.inventory.notify_observers_bulk([self.chair, self.table], "added")
+        self.observer1.bulk_update.assert_called_once_with([self.chair, self.table], "added")
+
+    def test_notify_observers_without_observers(self):
+        # Should be a no-op rather than an error
+        self.inventory.notify_observers(self.chair, "added")
+        self.inventory.notify_observers_bulk([self.chair], "added")
+
     def test_add_new_item(self):
         self.inventory.add_observer(self.observer1)
         self.inventory.add_item(self.chair)
@@ -202,6 +212,12 @@ class TestInventory(unittest.TestCase):
         self.assertEqual(list(self.inventory.items_by_type.keys()), ["Table"])
         self.assertEqual(list(self.inventory.items_by_type["Table"].keys()), ["Dining Table"])
 
+    def test_get_item(self):
+        self.inventory.add_item(self.chair)
+        self.assertIs(self.inventory.get_item("Office Chair", "Chair"), self.chair)
+        self.assertIsNone(self.inventory.get_item("Office Chair", "Table"))
+        self.assertIsNone(self.inventory.get_item("Gaming Chair", "Chair"))
+
     def test_update_quantity_existing_item(self):
         self.inventory.add_observer(self.observer1)
         self.inventory.add_item(self.chair)
@@ -218,6 +234,12 @@ class TestInventory(unittest.TestCase):
             self.assertIn("Item 'Gaming Chair' of type 'Chair' not found in inventory.", fake_output.getvalue())
         self.observer1.assert_not_called()
 
+    def test_find_by_name(self):
+        self.inventory.add_item(self.chair)
+        self.inventory.add_item(self.table)
+        self.assertIs(self.inventory.find_by_name("Dining Table"), self.table)
+        self.assertIsNone(self.inventory.find_by_name("Gaming Chair"))
+
     def test_test_search_existing_type(self):
         self.inventory.add_item(self.chair)
         self.inventory.add_item(self.table)
@@ -1,5 +1,4 @@
 import unittest
-from io import StringIO
 
 from unittest.mock import patch, MagicMock
 from inventory import InventoryObserver
@@ -20,45 +19,84 @@ class TestLowStockNotifier(unittest.TestCase):
     def test_initialization(self):
         self.assertEqual(self.default_notifier.threshold, 5)
         self.assertEqual(self.custom_notifier.threshold, 10)
+        self.assertFalse(self.default_notifier.buffered)
+        self.assertEqual(len(self.default_notifier.pending), 0)
 
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_update_low_stock_added(self, mock_stdout):
+    def test_update_low_stock_added(self):
         self.mock_item.available_quantity = 3
-        self.default_notifier.update(self.mock_item, "added")
-        self.assertIn("Warning: Low stock for Test Item! Only 3 left.", mock_stdout.getvalue())
+        with self.assertLogs("inventory", level="WARNING") as logs:
+            self.default_notifier.update(self.mock_item, "added")
+        self.assertIn("Warning: Low stock for Test Item! Only 3 left.", logs.output[0])
 
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_update_low_stock_updated(self, mock_stdout):
+    def test_update_low_stock_updated(self):
         self.mock_item.available_quantity = 2
-        self.default_notifier.update(self.mock_item, "updated")
-        self.assertIn("Warning: Low stock for Test Item! Only 2 left.", mock_stdout.getvalue())
+        with self.assertLogs("inventory", level="WARNING") as logs:
+            self.default_notifier.update(self.mock_item, "updated")
+        self.assertIn("Warning: Low stock for Test Item! Only 2 left.", logs.output[0])
 
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_update_sufficient_stock(self, mock_stdout):
+    @patch("inventory.logger")
+    def test_update_sufficient_stock(self, mock_logger):
         self.mock_item.available_quantity = 10
         self.default_notifier.update(self.mock_item, "added")
-        self.assertEqual(mock_stdout.getvalue(), "")
+        mock_logger.warning.assert_not_called()
 
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_update_different_change_type(self, mock_stdout):
+    @patch("inventory.logger")
+    def test_update_different_change_type(self, mock_logger):
         self.mock_item.available_quantity = 2
         self.default_notifier.update(self.mock_item, "removed")
-        self.assertEqual(mock_stdout.getvalue(), "")
+        mock_logger.warning.assert_not_called()
 
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_custom_threshold(self, mock_stdout):
+    @patch("inventory.logger")
+    def test_custom_threshold(self, mock_logger):
         self.mock_item.available_quantity = 8
         # This should trigger a warning with the custom threshold (10)
         self.custom_notifier.update(self.mock_item, "updated")
-        self.assertIn("Warning: Low stock for Test Item! Only 8 left.", mock_stdout.getvalue())
+        mock_logger.warning.assert_called_once_with("Warning: Low stock for Test Item! Only 8 left.")
 
         # Clear the mock
-        mock_stdout.truncate(0)
-        mock_stdout.seek(0)
+        mock_logger.reset_mock()
 
         # But it should not trigger a warning with the default threshold (5)
         self.default_notifier.update(self.mock_item, "updated")
-        self.assertEqual(mock_stdout.getvalue(), "")
+        mock_logger.warning.assert_not_called()
+
+    def test_bulk_update(self):
+        low_item = MagicMock()
+        low_item.name = "Low Item"
+        low_item.available_quantity = 1
+        self.mock_item.available_quantity = 20
+
+        with self.assertLogs("inventory", level="WARNING") as logs:
+            self.default_notifier.bulk_update([low_item, self.mock_item], "added")
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("Warning: Low stock for Low Item! Only 1 left.", logs.output[0])
+        self.assertNotIn("Test Item", logs.output[0])
+
+    @patch("inventory.logger")
+    def test_bulk_update_different_change_type(self, mock_logger):
+        self.mock_item.available_quantity = 1
+        self.default_notifier.bulk_update([self.mock_item], "removed")
+        mock_logger.warning.assert_not_called()
+
+    def test_buffered_warnings_are_logged_on_flush(self):
+        notifier = LowStockNotifier(buffered=True)
+        other_item = MagicMock()
+        other_item.name = "Other Item"
+        other_item.available_quantity = 0
+        self.mock_item.available_quantity = 1
+
+        with patch("inventory.logger") as mock_logger:
+            notifier.update(self.mock_item, "added")
+            notifier.update(other_item, "updated")
+            mock_logger.warning.assert_not_called()
+            self.assertEqual(len(notifier.pending), 2)
+
+        with self.assertLogs("inventory", level="WARNING") as logs:
+            notifier.flush()
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("Warning: Low stock for Test Item! Only 1 left.", logs.output[0])
+        self.assertIn("Warning: Low stock for Other Item! Only 0 left.", logs.output[0])
+        self.assertEqual(len(notifier.pending), 0)
 
 
 if __name__ == '__main__':
@@ -1,10 +1,12 @@
 import csv
 import sys
 import io
+import os
+import tempfile
 import unittest
 import uuid
 from unittest.mock import MagicMock, patch, mock_open
-from order import Order
+from order import Order, OrderCsvSink
 
 
 class TestOrder(unittest.TestCase):
@@ -31,6 +33,16 @@ class TestOrder(unittest.TestCase):
         self.assertEqual(self.order.shipping_address, self.mock_user.address)
         self.assertEqual(self.order.payment_method, self.mock_user.payment_method)
 
+    def test_order_id(self):
+        order = Order(self.mock_user, self.items, self.total_price)
+        self.assertEqual(len(order.order_id), 32)  # uuid4 hex, no hyphens
+        self.assertNotEqual(order.order_id, Order(self.mock_user, self.items, self.total_price).order_id)
+
+        self.assertEqual(uuid.UUID(order.order_id).version, 4)
+
+        preset_order = Order(self.mock_user, self.items, self.total_price, order_id="42")
+        self.assertEqual(preset_order.order_id, "42")
+
     def test_complete_order(self):
         self.assertEqual(self.order.status, "Pending")
         self.order.complete_order()
@@ -59,26 +71,42 @@ class TestOrder(unittest.TestCase):
         )
         self.assertEqual(str(self.order), expected)
 
-    @patch("os.path.exists")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_save_order_to_csv_new_file(self, mock_file, mock_exists):
+    def test_str_reflects_status_changes(self):
+        self.assertIn("Status: Pending", str(self.order))
+        self.order.complete_order()
+        self.assertIn("Status: Completed", str(self.order))
+        self.order.mark_as_delivered()
+        self.assertIn("Chair x 2, Table x 1, Bed x 1 | Total: $200.00 | Status: Delivered", str(self.order))
+
+    def save_and_read_rows(self, orders, header=False):
+        """
+        Save orders to a temporary CSV file and read its rows back.
+
+        param orders: Orders to save, a single order is saved with save_order_to_csv.
+        param header: Whether the file already exists with a header row.
+        return: The rows of the file and the mock that recorded the open() calls.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "test_orders.csv")
+            if header:
+                with open(filename, mode="w", newline="", encoding="utf-8") as file:
+                    csv.writer(file).writerow(Order.CSV_HEADER)
+            with patch("builtins.open", wraps=open) as mock_file:
+                if isinstance(orders, Order):
+                    orders.save_order_to_csv(filename)
+                else:
+                    Order.save_many_to_csv(orders, filename)
+
+            # Verify that the file was opened once in "append" mode
+            mock_file.assert_called_once_with(filename, mode="a", newline="", encoding="utf-8")
+            with open(filename, newline="", encoding="utf-8") as file:
+                return list(csv.reader(file))
+
+    def test_save_order_to_csv_new_file(self):
         """
         Test `save_order_to_csv` when the file does not exist.
         """
-        mock_exists.return_value = False  # Simulating a new file
-
-        csv_output = io.StringIO()
-        mock_file.return_value.__enter__.return_value = csv_output
-
-        self.order.save_order_to_csv("test_orders.csv")
-
-        # Verify that the file was opened in "append" mode
-        mock_file.assert_called_once_with("test_orders.csv", mode="a", newline="")
-        mock_exists.assert_called_once_with("test_orders.csv")
-
-        csv_output.seek(0)
-        csv_reader = csv.reader(csv_output)
-        rows = list(csv_reader)
+        rows = self.save_and_read_rows(self.order)
 
         # Validate header row
         self.assertEqual(rows[0], ["order_id", "user_email", "shipping_address", "payment_method",
@@ -91,29 +119,52 @@ class TestOrder(unittest.TestCase):
 
         self.assertEqual(rows[1], expected_row)
 
-    @patch("os.path.exists")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_save_order_to_csv_existing_file(self, mock_file, mock_exists):
+    def test_save_order_to_csv_existing_file(self):
         """
         Test `save_order_to_csv` when the file already exists.
         """
-        mock_exists.return_value = True  # Simulating an existing file
-
-        csv_output = io.StringIO()
-        mock_file.return_value.__enter__.return_value = csv_output
-
-        self.order.save_order_to_csv("test_orders.csv")
-
-        # Verify that the file was opened in "append" mode
-        mock_file.assert_called_once_with("test_orders.csv", mode="a", newline="")
-
-        csv_output.seek(0)
-        csv_reader = csv.reader(csv_output)
-        rows = list(csv_reader)
+        rows = self.save_and_read_rows(self.order, header=True)
 
         # Ensure that the header is not duplicated
-        if len(rows) > 1:
-            self.assertEqual(rows[1][0], "order_id")
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0][0], "order_id")
+        self.assertEqual(rows[1][0], "f47ac10b-58cc-4372-a567-0e02b2c3d479")
+
+    def test_save_many_to_csv(self):
+        """
+        Test `save_many_to_csv` writes all orders with a single file open.
+        """
+        second_order = Order(self.mock_user, [("Sofa", 1, 300.00)], 300)
+        rows = self.save_and_read_rows([self.order, second_order])
+
+        self.assertEqual(len(rows), 3)  # Header + 2 orders
+        self.assertEqual(rows[1][0], "f47ac10b-58cc-4372-a567-0e02b2c3d479")
+        self.assertEqual(rows[2][0], second_order.order_id)
+        self.assertEqual(rows[2][4], "Sofa x 1 ($300.00)")
+
+    def test_order_csv_sink_opens_file_once(self):
+        second_order = Order(self.mock_user, [("Sofa", 1, 300.00)], 300)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "orders.csv")
+            with patch("builtins.open", wraps=open) as mock_file:
+                with OrderCsvSink(filename) as sink:
+                    sink.append(self.order)
+                    sink.append(second_order)
+
+            self.assertEqual(mock_file.call_count, 1)
+            with open(filename, newline="", encoding="utf-8") as file:
+                rows = list(csv.reader(file))
+
+        self.assertEqual([row[0] for row in rows], ["order_id", self.order.order_id, second_order.order_id])
+        self.assertEqual(rows[2][4], "Sofa x 1 ($300.00)")
+
+    def test_csv_line_matches_csv_writer(self):
+        self.mock_user.address = 'Herzl 1, "Top floor"'
+        order = Order(self.mock_user, [("Chair", 2, 20.00)], 40)
+
+        expected = io.StringIO()
+        csv.writer(expected).writerow(order._row())
+        self.assertEqual(order._csv_line(), expected.getvalue())
 
     @patch('builtins.open', new_callable=mock_open)
     def test_load_orders_from_csv(self, mock_file):
@@ -165,6 +216,32 @@ class TestOrder(unittest.TestCase):
         orders = Order.load_orders_from_csv("non_existing_file.csv")
         self.assertEqual(orders, [])
 
+    def test_iter_orders_from_csv_is_lazy(self):
+        csv_data = ("order_id,user_email,shipping_address,payment_method,items,total_price,status\n"
+                    "1,test@example.com,123 Tel Aviv,Credit card,Chair x 2 ($20.00),$40.00,Completed\n"
+                    "2,test@example.com,123 Tel Aviv,Credit card,Bed x 1 ($100.00),$100.00,Pending\n")
+        mock_file = mock_open(read_data=csv_data)
+
+        with patch('builtins.open', mock_file), patch('builtins.print'):
+            orders = Order.iter_orders_from_csv("test_orders.csv")
+            mock_file.assert_not_called()  # Nothing is read until the first order is requested
+
+            first = next(orders)
+            self.assertEqual(first["order_id"], "1")
+            self.assertEqual(first["items"], ["Chair x 2 ($20.00)"])
+            self.assertEqual([order["order_id"] for order in orders], ["2"])
+
+    def test_load_orders_from_csv_parallel(self):
+        orders = [Order(self.mock_user, [("Chaise Longue Café", i, 20.00)], 20 * i) for i in range(1, 41)]
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "orders.csv")
+            with patch('builtins.print'):
+                Order.save_many_to_csv(orders, filename)
+                loaded = Order.load_orders_from_csv_parallel(filename, workers=3, min_parallel_size=0)
+                self.assertEqual(loaded, Order.load_orders_from_csv(filename))
+
+        self.assertEqual([order["order_id"] for order in loaded], [order.order_id for order in orders])
+
     @patch('builtins.open', new_callable=mock_open)
     def test_load_orders_from_csv_malformed_data(self, mock_file):
         csv_data = """order_id,user_email,shipping_address,payment_method,items,total_price
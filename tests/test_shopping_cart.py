@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import mock_open, patch, MagicMock
-from shopping_cart import ShoppingCart
+from shopping_cart import ShoppingCart, CartNotifier, CartObserver
 from furniture import Furniture, Chair, Table, VIPDiscount
 from User import User
 from inventory import Inventory
@@ -15,6 +15,23 @@ def mock_inventory():
     return inventory
 
 
+def write_carts_data(data):
+    """Write the given content to the test carts file as it is."""
+    with open("test_carts.csv", mode="w", newline="") as file:
+        file.write(data)
+
+
+def write_carts_file(*rows):
+    """Write the test carts file with the header and the given rows, as csv.writer does by default."""
+    write_carts_data("user_email,item_name,quantity,price\r\n" + "".join(row + "\r\n" for row in rows))
+
+
+def read_carts_file():
+    """Return the content of the test carts file."""
+    with open("test_carts.csv", mode="r", newline="") as file:
+        return file.read()
+
+
 @patch("order.open", new_callable=mock_open)
 @patch("csv.writer")
 def test_save_order_does_not_write_orders_csv(mock_csv_writer, mock_file):
@@ -113,6 +130,78 @@ class TestShoppingCart(unittest.TestCase):
         self.assertIn(self.chair, self.cart.cart_items)
         self.assertEqual(self.cart.cart_items[self.chair], 2)
 
+    def test_add_items_bulk(self):
+        """
+        Test adding several items at once notifies the observers a single time.
+        """
+        observer = MagicMock()
+        self.cart.add_observer(observer)
+
+        items = {self.chair: 2, self.table: 1}
+        self.cart.add_items_bulk(items)
+
+        self.assertEqual(self.cart.cart_items, {self.chair: 2, self.table: 1})
+        observer.bulk_update.assert_called_once_with(self.cart, "bulk_added", items)
+        observer.update.assert_not_called()
+
+    def test_observers_list_is_used_for_all_notifications(self):
+        """
+        Test observers added to or removed from the observers list directly are handled by both notify methods.
+        """
+        observer = MagicMock()
+        removed_observer = MagicMock()
+        self.cart.add_observer(removed_observer)
+        self.cart.observers.append(observer)
+        self.cart.observers.remove(removed_observer)
+
+        self.cart.add_item(self.chair, quantity=1)
+        self.cart.add_items_bulk({self.table: 1})
+
+        observer.update.assert_called_once_with(self.cart, "added", self.chair)
+        observer.bulk_update.assert_called_once_with(self.cart, "bulk_added", {self.table: 1})
+        removed_observer.update.assert_not_called()
+        removed_observer.bulk_update.assert_not_called()
+
+    def test_add_items_bulk_is_all_or_nothing(self):
+        """
+        Test an invalid item in a bulk addition leaves the cart unchanged.
+        """
+        with self.assertRaises(ValueError):
+            self.cart.add_items_bulk([(self.chair, 2), (self.table, 999)])
+        self.assertEqual(self.cart.cart_items, {})
+
+        self.cart.add_items_bulk([(self.chair, 2), (self.table, 1), (self.chair, 1)])
+        self.assertEqual(self.cart.cart_items, {self.chair: 3, self.table: 1})
+
+    def test_observer_without_bulk_update_gets_each_added_item(self):
+        """
+        Test that an observer that only implements update() is told about every item of a bulk addition.
+        """
+        class RecordingObserver(CartObserver):
+            def __init__(self):
+                self.changes = []
+
+            def update(self, cart, change_type, item=None):
+                self.changes.append((change_type, item))
+
+        observer = RecordingObserver()
+        self.cart.add_observer(observer)
+        self.cart.add_items_bulk({self.chair: 2, self.table: 1})
+
+        self.assertEqual(observer.changes, [("added", self.chair), ("added", self.table)])
+
+    @patch("builtins.print")
+    def test_cart_notifier(self, mock_print):
+        """
+        Test the cart notifier reports single and bulk additions.
+        """
+        self.cart.add_observer(CartNotifier())
+        self.cart.add_item(self.chair, quantity=1)
+        mock_print.assert_called_with("Item 'Office Chair' added to cart. ")
+
+        self.cart.add_items_bulk({self.chair: 2, self.table: 1})
+        mock_print.assert_called_with("3 items added to cart. ")
+
     def test_remove_item(self):
         """
         Test removing an item from the cart.
@@ -124,6 +213,18 @@ class TestShoppingCart(unittest.TestCase):
         self.cart.remove_item(self.chair, quantity=2)
         self.assertNotIn(self.chair, self.cart.cart_items)
 
+    @patch("builtins.print")
+    def test_view_cart(self, mock_print):
+        """
+        Test the cart is printed with a single call.
+        """
+        self.cart.add_item(self.chair, quantity=2)
+        self.cart.view_cart()
+        mock_print.assert_called_once_with(
+            "Shopping Cart for John Doe:\n"
+            "- Office Chair: 2 x $100.00 = $200.00\n"
+            f"Total: ${self.cart.calculate_total():.2f}")
+
     def test_calculate_total_no_discount(self):
         """
         Test calculating total price without discounts.
@@ -165,6 +266,65 @@ class TestShoppingCart(unittest.TestCase):
             order = self.cart.checkout()
             order.save_order_to_csv(filename="test_orders.csv")
 
+    @patch("shopping_cart.ShoppingCart.clear_cart_from_csv")
+    @patch("order.Order.save_order_to_csv")
+    @patch("shopping_cart.ShoppingCart.process_payment", return_value=True)
+    def test_checkout_deducts_stock(self, mock_payment, mock_save_order, mock_clear_cart):
+        """
+        Test that checkout deducts the bought quantities from the inventory and notifies its observers once.
+        """
+        chair_quantity = self.chair.available_quantity
+        table_quantity = self.table.available_quantity
+        self.cart.add_item(self.chair, quantity=2)
+        self.cart.add_item(self.table, quantity=1)
+
+        with patch.object(self.inventory, "notify_observers_bulk") as mock_notify, \
+                patch("builtins.print") as mock_print:
+            order = self.cart.checkout()
+
+        self.assertIsNotNone(order)
+        mock_print.assert_any_call(" 2 units of 'Office Chair' have been deducted from inventory.\n"
+                                   " 1 units of 'Dining Table' have been deducted from inventory.")
+        self.assertEqual(self.chair.available_quantity, chair_quantity - 2)
+        self.assertEqual(self.table.available_quantity, table_quantity - 1)
+        mock_notify.assert_called_once_with([self.chair, self.table], "updated")
+        self.assertEqual(self.cart.cart_items, {})
+
+    def make_chair_copy(self):
+        """
+        A separate Chair object with the same name and type as the inventory's office chair.
+        """
+        return Chair(u_id="001", name="Office Chair", description="Ergonomic office chair",
+                     material="Metal", color="Black", wp=2, price=100.0, dimensions=(60, 60, 120),
+                     country="USA", available_quantity=10, has_armrests=True)
+
+    @patch("shopping_cart.ShoppingCart.clear_cart_from_csv")
+    @patch("order.Order.save_order_to_csv")
+    @patch("shopping_cart.ShoppingCart.process_payment", return_value=True)
+    def test_checkout_adds_up_lines_of_the_same_item(self, mock_payment, mock_save_order, mock_clear_cart):
+        """
+        Test that cart lines of the same item (same name and type) are deducted together from the stock.
+        """
+        self.cart.add_item(self.chair, quantity=3)
+        self.cart.add_item(self.make_chair_copy(), quantity=4)
+
+        order = self.cart.checkout()
+
+        self.assertIsNotNone(order)
+        self.assertEqual(self.chair.available_quantity, 3)
+
+    @patch("shopping_cart.ShoppingCart.process_payment", return_value=True)
+    def test_checkout_checks_the_total_of_lines_of_the_same_item(self, mock_payment):
+        """
+        Test that checkout fails when lines of the same item together ask for more than the stock.
+        """
+        self.cart.add_item(self.chair, quantity=6)
+        self.cart.add_item(self.make_chair_copy(), quantity=6)
+
+        self.assertIsNone(self.cart.checkout())
+        self.assertEqual(self.chair.available_quantity, 10)
+        mock_payment.assert_not_called()
+
     def test_calculate_total(self):
         """Test calculating the total cost of items in the cart."""
         self.cart.add_item(self.chair, 2)
@@ -190,9 +350,11 @@ class TestShoppingCart(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.cart.add_item(self.chair, quantity=15)
 
+    @patch("os.fsync")
+    @patch("os.replace")
     @patch("shopping_cart.open", new_callable=mock_open)
     @patch("csv.writer", autospec=True)
-    def test_save_cart_to_csv(self, mock_csv_writer, mock_file):
+    def test_save_cart_to_csv(self, mock_csv_writer, mock_file, mock_replace, mock_fsync):
         """Test that the shopping cart is saved in the CSV."""
         mock_data = "user_email,item_name,quantity,price\n"
         m = mock_open(read_data=mock_data)
@@ -205,7 +367,11 @@ class TestShoppingCart(unittest.TestCase):
             self.cart.add_item(self.chair, 1)
             self.cart.save_cart_to_csv("test_carts.csv")
 
-            mock_file.assert_called_once_with("test_carts.csv", mode='w', newline='')
+            mock_file.assert_called_once()
+            temp_filename = mock_file.call_args.args[0]
+            self.assertRegex(temp_filename, r"^test_carts\.csv\..+\.tmp$")
+            self.assertEqual(mock_file.call_args.kwargs, {"mode": "w", "newline": ""})
+            mock_replace.assert_called_once_with(temp_filename, "test_carts.csv")
             print("Actual calls to writerows:", handle.writerows.call_args_list)
 
             expected_data = [
@@ -222,12 +388,15 @@ class TestShoppingCart(unittest.TestCase):
 
             print("Test Passed: CSV file saved correctly!")
 
+    @patch("os.fsync")
+    @patch("os.replace")
     @patch("shopping_cart.open", new_callable=mock_open)
     @patch("csv.writer", autospec=True)
     @patch("os.path.exists")
     @patch("os.stat")
     @patch("builtins.print")
-    def test_save_new_user_to_empty_file(self, mock_print, mock_stat, mock_exists, mock_csv_writer, mock_file):
+    def test_save_new_user_to_empty_file(self, mock_print, mock_stat, mock_exists, mock_csv_writer, mock_file,
+                                         mock_replace, mock_fsync):
         """Test saving cart to a new/empty file."""
         # Mock file as non-existent
         mock_exists.return_value = False
@@ -255,9 +424,11 @@ class TestShoppingCart(unittest.TestCase):
         mock_print.assert_any_call("File does not exist or is empty. Adding header.")
         mock_print.assert_any_call(f"Adding new cart for {self.user.email} to CSV.")
 
+    @patch("os.fsync")
+    @patch("os.replace")
     @patch("shopping_cart.open", new_callable=mock_open)
     @patch("csv.writer", autospec=True)
-    def test_update_existing_cart_in_csv(self, mock_csv_writer, mock_file):
+    def test_update_existing_cart_in_csv(self, mock_csv_writer, mock_file, mock_replace, mock_fsync):
         """Testing the existent user's cart updates in the file """
         initial_data = "user_email,item_name,quantity,price\njohn@example.com,Office Chair,2,200\n"
         m = mock_open(read_data=initial_data)
@@ -284,6 +455,8 @@ class TestShoppingCart(unittest.TestCase):
             assert any(expected_data_first_save[0] in call for call in actual_calls), \
                 f"Mismatch! Expected part of {expected_data_first_save} in {actual_calls}"
 
+    @patch("os.fsync")
+    @patch("os.replace")
     @patch("shopping_cart.open", new_callable=mock_open)
     @patch("csv.writer", autospec=True)
     @patch("csv.reader")
@@ -291,7 +464,7 @@ class TestShoppingCart(unittest.TestCase):
     @patch("os.stat")
     @patch("builtins.print")
     def test_update_existing_user(self, mock_print, mock_stat, mock_exists, mock_csv_reader, mock_csv_writer,
-                                  mock_file):
+                                  mock_file, mock_replace, mock_fsync):
         """Test updating an existing user's cart."""
         # Mock file as existing
         mock_exists.return_value = True
@@ -351,13 +524,16 @@ class TestShoppingCart(unittest.TestCase):
         # Verify correct message was printed
         mock_print.assert_any_call(f"Updating existing cart for {self.user.email} to CSV.")
 
+    @patch("os.fsync")
+    @patch("os.replace")
     @patch("shopping_cart.open", new_callable=mock_open)
     @patch("csv.writer", autospec=True)
     @patch("csv.reader")
     @patch("os.path.exists")
     @patch("os.stat")
     @patch("builtins.print")
-    def test_incorrect_header(self, mock_print, mock_stat, mock_exists, mock_csv_reader, mock_csv_writer, mock_file):
+    def test_incorrect_header(self, mock_print, mock_stat, mock_exists, mock_csv_reader, mock_csv_writer, mock_file,
+                              mock_replace, mock_fsync):
         """Test handling a file with incorrect headers."""
         # Mock file as existing
         mock_exists.return_value = True
@@ -406,13 +582,12 @@ class TestShoppingCart(unittest.TestCase):
 
     def test_load_cart_from_csv_successful(self):
         """Test successful loading of cart data for current user."""
-        # Create mock data with correct header and matching user email
+        # Create data with correct header and matching user email
         mock_data = "user_email,item_name,quantity,price\njohn@example.com,Office Chair,2,100\n"
 
-        with patch('os.path.exists', return_value=True), \
-                patch('builtins.open', mock_open(read_data=mock_data)), \
-                patch('builtins.print'):
-            self.cart.load_cart_from_csv("test_cart.csv")
+        write_carts_data(mock_data)
+        with patch('builtins.print'):
+            self.cart.load_cart_from_csv("test_carts.csv")
 
             # Verify the cart was loaded correctly
             self.assertEqual(len(self.cart.cart_items), 1)
@@ -431,10 +606,9 @@ class TestShoppingCart(unittest.TestCase):
         """Test loading cart with invalid CSV header."""
         mock_data = "invalid,header,format\njohn@example.com,Office Chair,1,100\n"
 
-        with patch('os.path.exists', return_value=True), \
-                patch('builtins.open', mock_open(read_data=mock_data)), \
-                patch('builtins.print') as mock_print:
-            self.cart.load_cart_from_csv("test_cart.csv")
+        write_carts_data(mock_data)
+        with patch('builtins.print') as mock_print:
+            self.cart.load_cart_from_csv("test_carts.csv")
 
             # Use a more flexible assertion that doesn't rely on exact string matching
             # Just check that the error message contains the key parts
@@ -450,28 +624,38 @@ class TestShoppingCart(unittest.TestCase):
 
     def test_load_cart_from_csv_different_user(self):
         """Test loading cart with data for a different user."""
-        # Create mock data with correct header but different user email
+        # Create data with correct header but different user email
         mock_data = "user_email,item_name,quantity,price\ndifferent@example.com,Office Chair,2,100\n"
 
-        with patch('os.path.exists', return_value=True), \
-                patch('builtins.open', mock_open(read_data=mock_data)), \
-                patch('builtins.print'):
-            self.cart.load_cart_from_csv("test_cart.csv")
+        write_carts_data(mock_data)
+        with patch('builtins.print'):
+            self.cart.load_cart_from_csv("test_carts.csv")
 
             # Cart should be empty since data is for a different user
             self.assertEqual(len(self.cart.cart_items), 0)
 
+    def test_load_cart_from_csv_similar_email(self):
+        """Test that rows of a user whose email starts with the current one are not loaded."""
+        mock_data = "user_email,item_name,quantity,price\n"
+        mock_data += "john@example.com.au,Office Chair,4,100\n"
+        mock_data += "john@example.com,Dining Table,1,250\n"
+
+        write_carts_data(mock_data)
+        with patch('builtins.print'):
+            self.cart.load_cart_from_csv("test_carts.csv")
+
+            self.assertEqual(self.cart.cart_items, {self.table: 1})
+
     def test_load_cart_from_csv_multiple_items(self):
         """Test loading cart with multiple items."""
-        # Create mock data with both chair and table for the current user
+        # Create data with both chair and table for the current user
         mock_data = "user_email,item_name,quantity,price\n"
         mock_data += "john@example.com,Office Chair,2,100\n"
         mock_data += "john@example.com,Dining Table,1,250\n"
 
-        with patch('os.path.exists', return_value=True), \
-                patch('builtins.open', mock_open(read_data=mock_data)), \
-                patch('builtins.print'):
-            self.cart.load_cart_from_csv("test_cart.csv")
+        write_carts_data(mock_data)
+        with patch('builtins.print'):
+            self.cart.load_cart_from_csv("test_carts.csv")
 
             # Verify both items were loaded correctly
             self.assertEqual(len(self.cart.cart_items), 2)
@@ -480,6 +664,79 @@ class TestShoppingCart(unittest.TestCase):
             self.assertIn(self.table, self.cart.cart_items)
             self.assertEqual(self.cart.cart_items[self.table], 1)
 
+    def test_save_cart_to_csv_keeps_other_carts(self):
+        """Test that saving a cart replaces the user's old rows and keeps other carts as they are."""
+        write_carts_data("user_email,item_name,quantity,price\n"
+                         "john@example.com,Dining Table,1,250.0\n"
+                         "other@example.com,Office Chair,3,100.0\n")
+
+        self.cart.add_item(self.chair, 2)
+        with patch("builtins.print"):
+            self.cart.save_cart_to_csv("test_carts.csv")
+
+        self.assertEqual(read_carts_file(),
+                         "user_email,item_name,quantity,price\n"
+                         "other@example.com,Office Chair,3,100.0\n"
+                         "john@example.com,Office Chair,2,100.0\n")
+
+    def test_save_cart_to_csv_failure_keeps_file_and_removes_temp_file(self):
+        """Test that a failed save leaves the carts file as it was and no temporary file behind."""
+        write_carts_file("other@example.com,Office Chair,3,100.0")
+        original = read_carts_file()
+
+        self.cart.add_item(self.chair, 2)
+        with patch("builtins.print"), patch("os.fsync", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.cart.save_cart_to_csv("test_carts.csv")
+
+        self.assertEqual(read_carts_file(), original)
+        self.assertEqual([name for name in os.listdir(".") if name.startswith("test_carts.csv.")], [])
+
+    def test_clear_cart_from_csv(self):
+        """Test that the user's rows at the end of the file are removed."""
+        write_carts_file("other@example.com,Dining Table,1,250",
+                         "john@example.com,Office Chair,2,100",
+                         "john@example.com,Dining Table,1,250")
+        self.cart.clear_cart_from_csv("test_carts.csv")
+
+        self.assertEqual(read_carts_file(),
+                         "user_email,item_name,quantity,price\r\nother@example.com,Dining Table,1,250\r\n")
+
+    def test_clear_cart_from_csv_followed_by_other_carts(self):
+        """Test that only the user's rows are removed when other carts come after them."""
+        write_carts_file("john@example.com,Office Chair,2,100",
+                         "john@example.com.au,Dining Table,1,250",
+                         "other@example.com,Office Chair,1,100")
+        self.cart.clear_cart_from_csv("test_carts.csv")
+
+        self.assertEqual(read_carts_file(),
+                         "user_email,item_name,quantity,price\r\n"
+                         "john@example.com.au,Dining Table,1,250\r\n"
+                         "other@example.com,Office Chair,1,100\r\n")
+
+    def test_clear_cart_from_csv_only_user_cart(self):
+        """Test that the file is removed when the user's cart was the only one."""
+        write_carts_file("john@example.com,Office Chair,2,100")
+        self.cart.clear_cart_from_csv("test_carts.csv")
+        self.assertFalse(os.path.exists("test_carts.csv"))
+
+    def test_clear_cart_from_csv_without_user_cart(self):
+        """Test that the file is not changed when the user has no saved cart."""
+        mock_data = b"user_email,item_name,quantity,price\nother@example.com,Dining Table,1,250\n"
+        m = mock_open(read_data=mock_data)
+
+        with patch("shopping_cart.open", m), patch("os.remove") as mock_remove:
+            self.cart.clear_cart_from_csv("test_carts.csv")
+
+        m.assert_called_once()
+        mock_remove.assert_not_called()
+
+    def test_clear_cart_from_csv_missing_file(self):
+        """Test that clearing a cart from a missing file does nothing."""
+        with patch("shopping_cart.open", side_effect=FileNotFoundError), patch("os.remove") as mock_remove:
+            self.cart.clear_cart_from_csv("test_carts.csv")
+        mock_remove.assert_not_called()
+
     def tearDown(self):
         """
         Cleanup after each test.
@@ -16,6 +16,8 @@ class TestUser(unittest.TestCase):
                          address="123 Main St",
                          payment_method="PayPal")
         self.test_filename = "users_database.csv"
+        # Some tests replace csv.writer directly, put the real one back so other test files aren't affected
+        self.addCleanup(setattr, csv, "writer", csv.writer)
 
     def test_user_creation(self):
         """Test user initialization with valid inputs"""